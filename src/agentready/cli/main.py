@@ -20,11 +20,7 @@ from ..reporters.html import HTMLReporter
 from ..reporters.markdown import MarkdownReporter
 from ..services.research_loader import ResearchLoader
 from ..services.scanner import Scanner
-from ..utils.security import (
-    SENSITIVE_DIRS,
-    VAR_SENSITIVE_SUBDIRS,
-    _is_path_in_directory,
-)
+from ..utils.security import _resolved_sensitive_dirs
 from ..utils.subprocess_utils import safe_subprocess_run
 
 # Lightweight commands - imported immediately
@@ -193,17 +189,14 @@ def run_assessment(
     repo_path = Path(repository_path).resolve()
 
     # Security: Warn when scanning sensitive directories
-    # Use centralized constants and proper boundary checking
-    is_sensitive = any(
-        _is_path_in_directory(repo_path, Path(p)) for p in SENSITIVE_DIRS
-    )
+    # Use centralized constants (resolved once) and proper boundary checking
+    sensitive_dirs, var_sensitive_subdirs = _resolved_sensitive_dirs()
+    is_sensitive = any(repo_path.is_relative_to(d) for d in sensitive_dirs)
 
     # Special handling for /var subdirectories (macOS)
     # Only warn for specific subdirectories, not temp folders
     if not is_sensitive:
-        is_sensitive = any(
-            _is_path_in_directory(repo_path, Path(p)) for p in VAR_SENSITIVE_SUBDIRS
-        )
+        is_sensitive = any(repo_path.is_relative_to(d) for d in var_sensitive_subdirs)
 
     if is_sensitive:
         click.confirm(
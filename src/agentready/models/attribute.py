@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Attribute:
     """Defines an agent-ready quality attribute from the research report.
 
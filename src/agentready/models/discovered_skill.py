@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from .citation import Citation
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredSkill:
     """Represents a pattern that could become a Claude Code skill.
 
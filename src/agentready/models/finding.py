@@ -6,7 +6,7 @@ from .attribute import Attribute
 from .citation import Citation
 
 
-@dataclass
+@dataclass(slots=True)
 class Remediation:
     """Actionable guidance for fixing a failing attribute.
 
@@ -46,7 +46,7 @@ class Remediation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Result of assessing a single attribute against a repository.
 
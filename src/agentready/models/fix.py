@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Fix(ABC):
     """Base class for automated fixes.
 
@@ -42,7 +42,7 @@ class Fix(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class FileCreationFix(Fix):
     """Fix that creates a new file.
 
@@ -78,7 +78,7 @@ class FileCreationFix(Fix):
         return f"CREATE {self.file_path} ({size_kb:.1f} KB)"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileModificationFix(Fix):
     """Fix that modifies an existing file.
 
@@ -125,7 +125,7 @@ class FileModificationFix(Fix):
         return f"MODIFY {self.file_path} (+{len(self.additions)} lines)"
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandFix(Fix):
     """Fix that executes a command.
 
@@ -180,7 +180,7 @@ class CommandFix(Fix):
         return f"RUN {self.command}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiStepFix(Fix):
     """Fix composed of multiple steps.
 
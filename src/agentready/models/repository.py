@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from .config import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class Repository:
     """Represents a git repository being assessed.
 
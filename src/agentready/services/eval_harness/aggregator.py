@@ -5,11 +5,54 @@ This module provides functionality to aggregate Terminal-Bench results across
 multiple repositories to identify high-impact vs low-impact assessors.
 """
 
+import numpy as np
 import pandas as pd
 
 # Significance threshold for mean delta (placeholder for statistical test)
 SIGNIFICANCE_THRESHOLD = 0.05
 
+# Zero-row summary with the full schema, returned for empty input
+_EMPTY_SUMMARY = pd.DataFrame(
+    {
+        "mean_delta": pd.Series(dtype=float),
+        "median_delta": pd.Series(dtype=float),
+        "std_delta": pd.Series(dtype=float),
+        "sample_size": pd.Series(dtype=int),
+        "significant": pd.Series(dtype=bool),
+    },
+    index=pd.Index([], name="assessor_id"),
+)
+
+
+def _grouped_median(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Compute per-group medians with a single sort over all values.
+
+    Sorting by (code, value) makes every group a contiguous, ordered slice,
+    so each median is read from the slice midpoint(s) without per-group sorts.
+    Like ``groupby().median()``, NaN values and missing group keys (code -1)
+    are skipped; a group with no remaining values gets a NaN median.
+
+    Args:
+        codes: Integer group code for each value (0..n_groups-1, -1 if missing)
+        values: Values to take medians of
+        n_groups: Number of distinct groups
+
+    Returns:
+        Array of medians indexed by group code
+    """
+    keep = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[keep], values[keep]
+    sorted_values = values[np.lexsort((values, codes))]
+    counts = np.bincount(codes, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    medians = np.full(n_groups, np.nan)
+    filled = counts > 0
+    lower = sorted_values[starts[filled] + (counts[filled] - 1) // 2]
+    upper = sorted_values[starts[filled] + counts[filled] // 2]
+    medians[filled] = 0.5 * (lower + upper)
+    return medians
+
 
 def aggregate_results(results: list[dict]) -> pd.DataFrame:
     """
@@ -43,29 +86,25 @@ def aggregate_results(results: list[dict]) -> pd.DataFrame:
         >>> summary.loc["claude_md"]["mean_delta"]
         0.11
     """
-    # Handle empty results
+    # Handle empty results (shallow copy so callers can't mutate the template)
     if not results:
-        return pd.DataFrame(
-            columns=[
-                "mean_delta",
-                "median_delta",
-                "std_delta",
-                "sample_size",
-                "significant",
-            ]
-        )
+        return _EMPTY_SUMMARY.copy(deep=False)
 
     # 1. Create DataFrame from results
     df = pd.DataFrame(results)
 
     # 2. Aggregate with pandas groupby
-    summary = df.groupby("assessor_id").agg(
-        {"delta_score": ["mean", "median", "std", "count"]}
+    summary = df.groupby("assessor_id").agg({"delta_score": ["mean", "std", "count"]})
+
+    # 3. Rename aggregated columns and add medians (sorted keys match groupby order)
+    summary.columns = ["mean_delta", "std_delta", "sample_size"]
+    codes, keys = pd.factorize(df["assessor_id"], sort=True)
+    summary.insert(
+        1,
+        "median_delta",
+        _grouped_median(codes, df["delta_score"].to_numpy(dtype=float), len(keys)),
     )
 
-    # 3. Rename aggregated columns
-    summary.columns = ["mean_delta", "median_delta", "std_delta", "sample_size"]
-
     # 4. Handle NaN in std (occurs with single value)
     summary["std_delta"] = summary["std_delta"].fillna(0.0)
 
@@ -75,7 +114,11 @@ def aggregate_results(results: list[dict]) -> pd.DataFrame:
     # 5. Add statistical significance placeholder
     # Placeholder: abs(mean_delta) > 0.05
     # Future: Replace with proper statistical test (t-test, etc.)
-    summary["significant"] = summary["mean_delta"].abs() > SIGNIFICANCE_THRESHOLD
+    # Computed on the raw mean buffer to avoid an intermediate Series
+    means = summary["mean_delta"].to_numpy()
+    summary["significant"] = np.greater(
+        np.abs(means), SIGNIFICANCE_THRESHOLD, out=np.empty_like(means, dtype=bool)
+    )
 
     # 6. Sort by mean_delta descending (highest impact first)
     summary = summary.sort_values("mean_delta", ascending=False)
@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import shlex
+import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
@@ -21,6 +22,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 3600  # 1 hour timeout per benchmark
 DEFAULT_N_CONCURRENT = 1  # Sequential execution (parallelism managed externally)
 
+# Harbor CLI resolved once at import so each launch skips the $PATH walk
+_HARBOR_BIN = shutil.which("harbor") or "harbor"
+
 
 @dataclass
 class TbenchResult:
@@ -90,7 +94,7 @@ def _real_tbench_result(repo_path: Path, config: HarborConfig) -> TbenchResult:
                 "Ensure preflight checks are enabled."
             )
         cmd = [
-            "harbor",
+            _HARBOR_BIN,
             "run",
             "--path",
             str(config.task_path),
@@ -107,7 +111,7 @@ def _real_tbench_result(repo_path: Path, config: HarborConfig) -> TbenchResult:
     else:
         # Full benchmark: use dataset reference
         cmd = [
-            "harbor",
+            _HARBOR_BIN,
             "run",
             "--dataset",
             "terminal-bench@2.0",
@@ -170,6 +174,8 @@ def _real_tbench_result(repo_path: Path, config: HarborConfig) -> TbenchResult:
     logger.info(f"Environment: {' '.join(env_vars_display)}")
 
     # 4. Execute subprocess with timeout
+    # No preexec_fn/pass_fds/new session: keeps CPython on its vfork/posix_spawn
+    # fast path so launch cost doesn't scale with the parent's memory footprint.
     try:
         subprocess.run(
             cmd,
@@ -234,8 +240,7 @@ def parse_harbor_results(
         json.JSONDecodeError: If result.json is invalid JSON
         KeyError: If required fields missing from results
     """
-    with open(results_path) as f:
-        data = json.load(f)
+    data = json.loads(results_path.read_bytes())
 
     # Harbor structure: stats.evals.<eval_name>.{n_trials, n_errors, metrics}
     stats = data["stats"]
@@ -1,6 +1,7 @@
 """Service for orchestrating automated fixes."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List
 
 from ..fixers.base import BaseFixer
@@ -28,16 +29,42 @@ class FixPlan:
     points_gained: float
 
 
+@lru_cache(maxsize=1)
+def _default_fixers() -> tuple[BaseFixer, ...]:
+    """Build the default fixers once; fixers are stateless and safe to share."""
+    return (
+        CLAUDEmdFixer(),
+        GitignoreFixer(),
+        PrecommitHooksFixer(),
+    )
+
+
 class FixerService:
     """Orchestrates automated remediation of failing attributes."""
 
     def __init__(self):
         """Initialize with all available fixers."""
-        self.fixers: List[BaseFixer] = [
-            CLAUDEmdFixer(),
-            GitignoreFixer(),
-            PrecommitHooksFixer(),
-        ]
+        self._fixers: list[BaseFixer] = []
+        self._fixers_by_attribute: dict[str, BaseFixer] = {}
+        for fixer in _default_fixers():
+            self.register(fixer)
+
+    @property
+    def fixers(self) -> tuple[BaseFixer, ...]:
+        """Registered fixers in registration order (use register() to add)."""
+        return tuple(self._fixers)
+
+    def register(self, fixer: BaseFixer) -> None:
+        """Register a fixer.
+
+        If several fixers handle the same attribute, the first one registered
+        is used.
+
+        Args:
+            fixer: Fixer to add
+        """
+        self._fixers.append(fixer)
+        self._fixers_by_attribute.setdefault(fixer.attribute_id, fixer)
 
     def generate_fix_plan(
         self,
@@ -115,9 +142,6 @@ class FixerService:
 
         return results
 
-    def _find_fixer(self, attribute_id: str) -> BaseFixer:
+    def _find_fixer(self, attribute_id: str) -> BaseFixer | None:
         """Find fixer for attribute ID."""
-        for fixer in self.fixers:
-            if fixer.attribute_id == attribute_id:
-                return fixer
-        return None
+        return self._fixers_by_attribute.get(attribute_id)
@@ -13,6 +13,7 @@ Security principles:
 
 import html
 import re
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +26,33 @@ VAR_SENSITIVE_SUBDIRS = [
     "/private/var/root",
 ]
 
+# Escaped safe tags restored by sanitize_for_html(allow_safe_tags=True);
+# matches only bare tags such as &lt;b&gt; or &lt;/code&gt; (no attributes)
+_ESCAPED_SAFE_TAG_RE = re.compile(r"&lt;(/?)(code|pre|b|i|em|strong|br|hr)&gt;")
+
+# str.translate table dropping control characters (except \t, \n, \r) and DEL
+_JSON_CONTROL_CHARS = dict.fromkeys(
+    [*range(0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+)
+
+# URL schemes for validate_url
+DANGEROUS_URL_SCHEMES = frozenset({"javascript", "data", "vbscript", "file"})
+DEFAULT_URL_SCHEMES = ("http", "https", "ftp", "ftps")
+
+
+@cache
+def _resolved_sensitive_dirs() -> tuple[tuple[Path, ...], tuple[Path, ...]]:
+    """Resolve SENSITIVE_DIRS and VAR_SENSITIVE_SUBDIRS once per process.
+
+    Only these fixed absolute system paths are cached. Paths under validation
+    are never cached: a symlink created after a cached lookup must still be
+    followed.
+    """
+    return (
+        tuple(Path(p).resolve() for p in SENSITIVE_DIRS),
+        tuple(Path(p).resolve() for p in VAR_SENSITIVE_SUBDIRS),
+    )
+
 
 def _is_path_in_directory(path: Path, directory: Path) -> bool:
     """Check if path is within directory (proper boundary checking).
@@ -96,26 +124,23 @@ def validate_path(
     # Check if path is within base directory (if specified)
     if base_dir is not None:
         base_resolved = Path(base_dir).resolve()
-        try:
-            resolved_path.relative_to(base_resolved)
-        except ValueError:
+        if not resolved_path.is_relative_to(base_resolved):
             raise ValueError(
                 f"Path traversal detected: {resolved_path} is outside {base_resolved}"
             )
 
     # Block sensitive system directories (unless explicitly allowed)
     if not allow_system_dirs:
+        sensitive_dirs, var_sensitive_subdirs = _resolved_sensitive_dirs()
+
         # Check if path is within any sensitive directory (proper boundary checking)
-        is_sensitive = any(
-            _is_path_in_directory(resolved_path, Path(p)) for p in SENSITIVE_DIRS
-        )
+        is_sensitive = any(resolved_path.is_relative_to(d) for d in sensitive_dirs)
 
         # Special handling for /var subdirectories (macOS)
         # Only block specific subdirectories, not temp folders
         if not is_sensitive:
             is_sensitive = any(
-                _is_path_in_directory(resolved_path, Path(p))
-                for p in VAR_SENSITIVE_SUBDIRS
+                resolved_path.is_relative_to(d) for d in var_sensitive_subdirs
             )
 
         if is_sensitive:
@@ -155,9 +180,8 @@ def validate_config_dict(data: Any, schema: dict[str, type]) -> dict:
     if not isinstance(data, dict):
         raise ValueError(f"Config must be a dict, got {type(data).__name__}")
 
-    # Validate no unknown keys
-    allowed_keys = set(schema.keys())
-    unknown_keys = set(data.keys()) - allowed_keys
+    # Validate no unknown keys (set difference directly on the key views)
+    unknown_keys = data.keys() - schema.keys()
     if unknown_keys:
         raise ValueError(f"Unknown config keys: {', '.join(sorted(unknown_keys))}")
 
@@ -173,7 +197,7 @@ def validate_config_dict(data: Any, schema: dict[str, type]) -> dict:
         if isinstance(expected_type, dict):
             if not isinstance(value, dict):
                 raise ValueError(f"'{key}' must be a dict, got {type(value).__name__}")
-            key_type, val_type = list(expected_type.items())[0]
+            key_type, val_type = next(iter(expected_type.items()))
             for k, v in value.items():
                 if not isinstance(k, key_type):
                     raise ValueError(
@@ -235,13 +259,9 @@ def sanitize_for_html(text: str, allow_safe_tags: bool = False) -> str:
     # Always escape HTML special characters
     escaped = html.escape(str(text), quote=True)
 
-    # If safe tags allowed, unescape them
+    # If safe tags allowed, unescape opening and closing tags in a single pass
     if allow_safe_tags:
-        safe_tags = ["code", "pre", "b", "i", "em", "strong", "br", "hr"]
-        for tag in safe_tags:
-            # Unescape opening and closing tags
-            escaped = escaped.replace(f"&lt;{tag}&gt;", f"<{tag}>")
-            escaped = escaped.replace(f"&lt;/{tag}&gt;", f"</{tag}>")
+        escaped = _ESCAPED_SAFE_TAG_RE.sub(r"<\1\2>", escaped)
 
     return escaped
 
@@ -278,8 +298,7 @@ def sanitize_for_json(obj: Any, max_depth: int = 10) -> Any:
     # Handle strings (validate no control characters except newline/tab)
     if isinstance(obj, str):
         # Remove dangerous control characters but keep \n and \t
-        safe_str = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", obj)
-        return safe_str
+        return obj.translate(_JSON_CONTROL_CHARS)
 
     # Handle lists recursively
     if isinstance(obj, (list, tuple)):
@@ -316,26 +335,22 @@ def validate_url(url: str, allowed_schemes: list[str] | None = None) -> str:
         raise ValueError("URL cannot be empty")
 
     if allowed_schemes is None:
-        allowed_schemes = ["http", "https", "ftp", "ftps"]
+        allowed_schemes = DEFAULT_URL_SCHEMES
 
-    # Check for dangerous schemes
-    dangerous_schemes = ["javascript", "data", "vbscript", "file"]
+    # Split off the scheme once; membership tests replace per-scheme prefix scans
     url_lower = url.lower().strip()
+    scheme, has_colon, _ = url_lower.partition(":")
 
-    for scheme in dangerous_schemes:
-        if url_lower.startswith(f"{scheme}:"):
-            raise ValueError(f"Dangerous URL scheme: {scheme}")
-
-    # Validate allowed schemes
-    has_allowed_scheme = any(
-        url_lower.startswith(f"{scheme}:") for scheme in allowed_schemes
-    )
+    # Check for dangerous schemes
+    if has_colon and scheme in DANGEROUS_URL_SCHEMES:
+        raise ValueError(f"Dangerous URL scheme: {scheme}")
 
     # Allow relative URLs (no scheme)
     if ":" not in url_lower.split("/")[0]:
         return url
 
-    if not has_allowed_scheme:
+    # Validate allowed schemes
+    if scheme not in allowed_schemes:
         raise ValueError(f"URL must use allowed scheme: {', '.join(allowed_schemes)}")
 
     return url
@@ -376,7 +391,7 @@ def validate_filename(filename: str, allow_path_separators: bool = False) -> str
             raise ValueError("Filename cannot contain path separators (/ or \\)")
 
     # Check for dangerous patterns
-    if filename.startswith(".") and len(filename) > 1 and filename[1] == ".":
+    if filename.startswith(".."):
         raise ValueError("Filename cannot start with '..' (path traversal)")
 
     return filename
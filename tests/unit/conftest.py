@@ -0,0 +1,95 @@
+"""Shared fixtures for unit tests."""
+
+import json
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory):
+    """Git-initialized directory built once per session and copied per test."""
+    template = tmp_path_factory.mktemp("git_template")
+    # Minimal .git scaffold satisfies Repository model validation without
+    # shelling out to git; it is not usable for real git commands
+    git_dir = template / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "objects").mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "config").write_text("[core]\n\trepositoryformatversion = 0\n")
+
+    # Read-only so copies can hard-link these files instead of duplicating them
+    for path in git_dir.rglob("*"):
+        if path.is_file():
+            path.chmod(0o444)
+    return template
+
+
+@pytest.fixture(scope="session")
+def assessment_payload():
+    """Sample assessment data shared across the session.
+
+    The repository path does not exist, so LearningService falls back to the
+    repository containing .agentready/ (see test_learning_service.py).
+    """
+    return {
+        "schema_version": "1.0.0",
+        "timestamp": "2025-11-22T06:00:00",
+        "repository": {
+            "name": "test-repo",
+            "path": "/nonexistent/test-repo",
+            "url": None,
+            "branch": "main",
+            "commit_hash": "abc123",
+            "languages": {"Python": 100},
+            "total_files": 5,
+            "total_lines": 100,
+        },
+        "overall_score": 85.0,
+        "certification_level": "Gold",
+        "attributes_assessed": 2,
+        "attributes_not_assessed": 0,
+        "attributes_total": 2,
+        "findings": [
+            {
+                "attribute": {
+                    "id": "claude_md_file",
+                    "name": "CLAUDE.md File",
+                    "category": "Documentation",
+                    "tier": 1,
+                    "description": "Test attribute",
+                    "criteria": "Must exist",
+                    "default_weight": 1.0,
+                },
+                "status": "pass",
+                "score": 100.0,
+                "measured_value": "present",
+                "threshold": "present",
+                "evidence": ["CLAUDE.md exists at root"],
+                "error_message": None,
+            },
+            {
+                "attribute": {
+                    "id": "type_annotations",
+                    "name": "Type Annotations",
+                    "category": "Code Quality",
+                    "tier": 2,
+                    "description": "Type hints in Python code",
+                    "criteria": ">=80% coverage",
+                    "default_weight": 1.0,
+                },
+                "status": "pass",
+                "score": 90.0,
+                "measured_value": "90%",
+                "threshold": "80%",
+                "evidence": ["90% of functions have type hints"],
+                "error_message": None,
+            },
+        ],
+        "duration_seconds": 1.5,
+    }
+
+
+@pytest.fixture(scope="session")
+def assessment_bytes(assessment_payload):
+    """Sample assessment serialized to JSON once per session."""
+    return json.dumps(assessment_payload).encode()
@@ -140,3 +140,26 @@ class TestAggregationEdgeCases:
         summary = aggregate_results(results)
         assert summary.loc["regression"]["mean_delta"] < 0
         assert not summary.loc["regression"]["significant"]  # abs < 0.05
+
+    def test_nan_delta_scores_skipped(self):
+        """Test that NaN deltas are excluded from median and sample size"""
+        results = [
+            {"assessor_id": "claude_md", "delta_score": 0.1},
+            {"assessor_id": "claude_md", "delta_score": float("nan")},
+            {"assessor_id": "claude_md", "delta_score": 0.3},
+        ]
+        summary = aggregate_results(results)
+        assert summary.loc["claude_md"]["median_delta"] == pytest.approx(0.2)
+        assert summary.loc["claude_md"]["sample_size"] == 2
+
+    def test_missing_assessor_id_dropped(self):
+        """Test that rows without an assessor_id are dropped, not an error"""
+        results = [
+            {"assessor_id": "claude_md", "delta_score": 0.10},
+            {"assessor_id": None, "delta_score": 0.50},
+            {"assessor_id": "claude_md", "delta_score": 0.20},
+        ]
+        summary = aggregate_results(results)
+        assert summary.index.tolist() == ["claude_md"]
+        assert summary.loc["claude_md"]["median_delta"] == pytest.approx(0.15)
+        assert summary.loc["claude_md"]["sample_size"] == 2
@@ -8,158 +8,180 @@ Following TDD red-green-refactor workflow:
 - Phase 3.7 (REFACTOR): Add docstrings and improve code quality
 """
 
+import importlib.util
 import json
 import subprocess
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from agentready.services.eval_harness import tbench_runner
+from agentready.services.eval_harness.harbor_config import HarborConfig
 from agentready.services.eval_harness.tbench_runner import (
     TbenchResult,
+    _real_tbench_result,
     parse_harbor_results,
 )
 
+# Harbor result.json payload (stats.evals.<eval_name> layout)
+HARBOR_RESULTS = {
+    "n_total_trials": 2,
+    "stats": {
+        "evals": {
+            "terminal-bench": {
+                "metrics": [{"mean": 0.5}],
+                "reward_stats": {"reward": {"1.0": ["task-a"], "0.0": ["task-b"]}},
+            }
+        }
+    },
+}
+
+
+@pytest.fixture
+def harbor_config(tmp_path):
+    """HarborConfig whose jobs_dir holds a timestamped run with result.json."""
+    run_dir = tmp_path / "jobs" / "2025-01-01__00-00-00"
+    run_dir.mkdir(parents=True)
+    (run_dir / "result.json").touch()
+    return HarborConfig(
+        model="anthropic/claude-haiku-4-5",
+        agent="claude-code",
+        jobs_dir=tmp_path / "jobs",
+        api_key="test-key",
+    )
+
 
 class TestHarborSubprocessIntegration:
     """Test Harbor subprocess execution with security validations (T023-T027)"""
 
     @patch("agentready.services.eval_harness.tbench_runner.subprocess.run")
-    def test_real_tbench_result_subprocess_called(self, mock_run):
+    def test_real_tbench_result_subprocess_called(self, mock_run, harbor_config):
         """T023: Verify harbor run command constructed correctly"""
         # Mock subprocess success and results file
         mock_run.return_value = MagicMock(returncode=0)
 
-        mock_results = {
-            "summary": {
-                "resolved_trials": 42,
-                "unresolved_trials": 8,
-                "accuracy": 0.84,
-                "pass@1": 0.78,
-                "pass@3": 0.84,
-            }
-        }
-
-        with patch("builtins.open", mock_open(read_data=json.dumps(mock_results))):
-            with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-                from agentready.services.eval_harness.tbench_runner import (
-                    _real_tbench_result,
-                )
+        with patch(
+            "pathlib.Path.read_bytes", return_value=json.dumps(HARBOR_RESULTS).encode()
+        ):
+            result = _real_tbench_result(Path("/fake/repo"), harbor_config)
+
+        # Results were parsed from the mocked read_bytes payload
+        assert result.score == 0.5
+        assert result.resolved_trials == 1
+        assert result.unresolved_trials == 1
+
+        # Verify subprocess.run was called
+        assert mock_run.called
+
+        # Verify command structure
+        call_args = mock_run.call_args[0][0]
+        assert call_args[0].endswith("harbor")
+        assert "run" in call_args
+        assert "--dataset" in call_args
+        assert "terminal-bench@2.0" in call_args
+        assert "--agent" in call_args
+        assert "claude-code" in call_args
+        assert "--model" in call_args
 
-                _real_tbench_result(Path("/fake/repo"))
+    @patch("agentready.services.eval_harness.tbench_runner.subprocess.run")
+    @patch("agentready.services.eval_harness.tbench_runner._HARBOR_BIN", "harbor")
+    def test_harbor_bin_used_as_command(self, mock_run, harbor_config):
+        """Verify the import-time resolved Harbor binary starts the command"""
+        mock_run.return_value = MagicMock(returncode=0)
 
-                # Verify subprocess.run was called
-                assert mock_run.called
+        with patch(
+            "pathlib.Path.read_bytes", return_value=json.dumps(HARBOR_RESULTS).encode()
+        ):
+            _real_tbench_result(Path("/fake/repo"), harbor_config)
+
+        assert mock_run.call_args[0][0][0] == "harbor"
+
+    @pytest.mark.parametrize(
+        ("which_result", "expected"),
+        [("/usr/local/bin/harbor", "/usr/local/bin/harbor"), (None, "harbor")],
+    )
+    def test_harbor_bin_resolved_at_import(self, which_result, expected):
+        """Verify _HARBOR_BIN uses shutil.which, falling back to bare 'harbor'"""
+        # Load a private copy so the shared module object is left untouched
+        spec = importlib.util.spec_from_file_location(
+            "_tbench_runner_copy", tbench_runner.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        with patch("shutil.which", return_value=which_result):
+            spec.loader.exec_module(module)
 
-                # Verify command structure
-                call_args = mock_run.call_args[0][0]
-                assert "harbor" in call_args
-                assert "run" in call_args
-                assert "--dataset" in call_args
-                assert "terminal-bench@2.0" in call_args
-                assert "--agent" in call_args
-                assert "claude-code" in call_args
-                assert "--model" in call_args
+        assert module._HARBOR_BIN == expected
 
     @patch("agentready.services.eval_harness.tbench_runner.subprocess.run")
-    def test_environment_variable_sanitization(self, mock_run):
-        """T024 [US3]: Verify only ANTHROPIC_API_KEY, PATH, HOME passed to subprocess"""
+    def test_environment_variable_sanitization(self, mock_run, harbor_config):
+        """T024 [US3]: Verify Harbor inherits the environment minus MiniMax settings"""
         mock_run.return_value = MagicMock(returncode=0)
 
-        mock_results = {
-            "summary": {
-                "resolved_trials": 1,
-                "unresolved_trials": 0,
-                "accuracy": 1.0,
-                "pass@1": 1.0,
-                "pass@3": 1.0,
-            }
-        }
-
-        with patch("builtins.open", mock_open(read_data=json.dumps(mock_results))):
-            # Set multiple environment variables
+        with patch(
+            "pathlib.Path.read_bytes", return_value=json.dumps(HARBOR_RESULTS).encode()
+        ):
             with patch.dict(
                 "os.environ",
                 {
-                    "ANTHROPIC_API_KEY": "test-key",
+                    "ANTHROPIC_API_KEY": "stale-key",
                     "PATH": "/usr/bin",
                     "HOME": "/home/user",
-                    "JAVA_HOME": "/opt/java",  # Should NOT be passed
-                    "SECRET_TOKEN": "secret123",  # Should NOT be passed
+                    "DOCKER_HOST": "unix:///run/docker.sock",  # Needed by Harbor
+                    "HTTPS_PROXY": "http://proxy:3128",  # Needed behind proxies
+                    "MINIMAX_API_KEY": "minimax-key",  # Should NOT be passed
                 },
             ):
-                from agentready.services.eval_harness.tbench_runner import (
-                    _real_tbench_result,
-                )
+                _real_tbench_result(Path("/fake/repo"), harbor_config)
 
-                _real_tbench_result(Path("/fake/repo"))
+        # Verify env parameter
+        call_kwargs = mock_run.call_args[1]
+        clean_env = call_kwargs["env"]
 
-                # Verify env parameter
-                call_kwargs = mock_run.call_args[1]
-                clean_env = call_kwargs["env"]
+        # Inherited environment (Docker, proxies, PATH, HOME) is preserved
+        assert clean_env["PATH"] == "/usr/bin"
+        assert clean_env["HOME"] == "/home/user"
+        assert clean_env["DOCKER_HOST"] == "unix:///run/docker.sock"
+        assert clean_env["HTTPS_PROXY"] == "http://proxy:3128"
 
-                # Required env vars present
-                assert "ANTHROPIC_API_KEY" in clean_env
-                assert "PATH" in clean_env
-                assert "HOME" in clean_env
+        # API key comes from the config and MiniMax settings are cleared
+        assert clean_env["ANTHROPIC_API_KEY"] == "test-key"
+        assert clean_env["ANTHROPIC_BASE_URL"] == "https://api.anthropic.com"
+        assert "MINIMAX_API_KEY" not in clean_env
 
-                # Forbidden env vars NOT present
-                assert "JAVA_HOME" not in clean_env
-                assert "SECRET_TOKEN" not in clean_env
+        # No preexec_fn, so the vfork/posix_spawn fast path stays usable
+        assert call_kwargs.get("preexec_fn") is None
 
     @patch("agentready.services.eval_harness.tbench_runner.subprocess.run")
-    def test_harbor_subprocess_timeout_enforced(self, mock_run):
+    def test_harbor_subprocess_timeout_enforced(self, mock_run, harbor_config):
         """T025: Verify subprocess.run called with timeout=3600"""
         mock_run.return_value = MagicMock(returncode=0)
 
-        mock_results = {
-            "summary": {
-                "resolved_trials": 1,
-                "unresolved_trials": 0,
-                "accuracy": 1.0,
-                "pass@1": 1.0,
-                "pass@3": 1.0,
-            }
-        }
-
-        with patch("builtins.open", mock_open(read_data=json.dumps(mock_results))):
-            with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-                from agentready.services.eval_harness.tbench_runner import (
-                    _real_tbench_result,
-                )
-
-                _real_tbench_result(Path("/fake/repo"))
+        with patch(
+            "pathlib.Path.read_bytes", return_value=json.dumps(HARBOR_RESULTS).encode()
+        ):
+            _real_tbench_result(Path("/fake/repo"), harbor_config)
 
-                # Verify timeout parameter
-                call_kwargs = mock_run.call_args[1]
-                assert call_kwargs["timeout"] == 3600
+        # Verify timeout parameter
+        call_kwargs = mock_run.call_args[1]
+        assert call_kwargs["timeout"] == 3600
 
     @patch("agentready.services.eval_harness.tbench_runner.subprocess.run")
-    def test_harbor_subprocess_timeout_exception(self, mock_run):
+    def test_harbor_subprocess_timeout_exception(self, mock_run, harbor_config):
         """T026: Verify RuntimeError raised when subprocess times out"""
         mock_run.side_effect = subprocess.TimeoutExpired("harbor", 3600)
 
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            from agentready.services.eval_harness.tbench_runner import (
-                _real_tbench_result,
-            )
-
-            with pytest.raises(RuntimeError, match="timed out"):
-                _real_tbench_result(Path("/fake/repo"))
+        with pytest.raises(RuntimeError, match="timed out"):
+            _real_tbench_result(Path("/fake/repo"), harbor_config)
 
     @patch("agentready.services.eval_harness.tbench_runner.subprocess.run")
-    def test_harbor_subprocess_failure_exception(self, mock_run):
+    def test_harbor_subprocess_failure_exception(self, mock_run, harbor_config):
         """T027: Verify RuntimeError raised when subprocess fails"""
         mock_run.side_effect = subprocess.CalledProcessError(1, "harbor")
 
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            from agentready.services.eval_harness.tbench_runner import (
-                _real_tbench_result,
-            )
-
-            with pytest.raises(RuntimeError, match="failed"):
-                _real_tbench_result(Path("/fake/repo"))
+        with pytest.raises(RuntimeError, match="failed"):
+            _real_tbench_result(Path("/fake/repo"), harbor_config)
 
 
 class TestJSONParsingWithPathValidation:
@@ -167,44 +189,24 @@ class TestJSONParsingWithPathValidation:
 
     def test_parse_harbor_results_valid_json(self):
         """T028 [US3]: Verify results.json parsed correctly"""
-        mock_results = {
-            "summary": {
-                "resolved_trials": 42,
-                "unresolved_trials": 8,
-                "accuracy": 0.84,
-                "pass@1": 0.78,
-                "pass@3": 0.84,
-            }
-        }
-
         with tempfile.TemporaryDirectory() as tmpdir:
-            results_path = Path(tmpdir) / "results.json"
+            results_path = Path(tmpdir) / "result.json"
             with open(results_path, "w") as f:
-                json.dump(mock_results, f)
+                json.dump(HARBOR_RESULTS, f)
 
             result = parse_harbor_results(results_path)
 
             assert isinstance(result, TbenchResult)
-            assert result.score == 0.84
-            assert result.resolved_trials == 42
-            assert result.unresolved_trials == 8
+            assert result.score == 0.5
+            assert result.resolved_trials == 1
+            assert result.unresolved_trials == 1
 
     def test_parse_harbor_results_creates_tbench_result(self):
         """T029: Verify TbenchResult created with is_mocked=False"""
-        mock_results = {
-            "summary": {
-                "resolved_trials": 10,
-                "unresolved_trials": 5,
-                "accuracy": 0.67,
-                "pass@1": 0.60,
-                "pass@3": 0.67,
-            }
-        }
-
         with tempfile.TemporaryDirectory() as tmpdir:
-            results_path = Path(tmpdir) / "results.json"
+            results_path = Path(tmpdir) / "result.json"
             with open(results_path, "w") as f:
-                json.dump(mock_results, f)
+                json.dump(HARBOR_RESULTS, f)
 
             result = parse_harbor_results(results_path)
 
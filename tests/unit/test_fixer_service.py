@@ -1,7 +1,9 @@
 """Unit tests for fixer service."""
 
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -10,54 +12,52 @@ from agentready.models import Assessment, Attribute, Finding, Repository
 from agentready.models.fix import FileCreationFix
 from agentready.services.fixer_service import FixerService, FixPlan
 
+# Fixed assessment timestamp; keeps fixtures deterministic and avoids clock reads
+FIXED_TIMESTAMP = datetime(2024, 1, 1)
 
-class MockFixer(BaseFixer):
-    """Mock fixer for testing."""
 
-    def __init__(self, attr_id: str, can_fix_result: bool = True):
-        self._attr_id = attr_id
-        self._can_fix_result = can_fix_result
+class FailingFix(FileCreationFix):
+    """File creation fix whose apply always raises."""
 
-    @property
-    def attribute_id(self) -> str:
-        return self._attr_id
+    def apply(self, dry_run=False):
+        raise RuntimeError("Intentional failure")
 
-    def can_fix(self, finding: Finding) -> bool:
-        return self._can_fix_result
 
-    def generate_fix(self, repository: Repository, finding: Finding):
-        if not self.can_fix(finding):
-            return None
+@dataclass
+class FixPlanCase:
+    """Inputs and expected outputs for one generate_fix_plan scenario.
 
-        return FileCreationFix(
-            attribute_id=self._attr_id,
-            description=f"Fix for {self._attr_id}",
-            points_gained=10.0,
-            file_path=Path("test.txt"),
-            content="test content",
-            repository_path=repository.path,
-        )
+    findings and fixers are (attribute_id, status) and (attribute_id, can_fix)
+    pairs; an empty fixers list leaves only the default fixers registered.
+    """
 
+    overall_score: float
+    findings: list[tuple[str, str]]
+    fixers: list[tuple[str, bool]]
+    expected_fix_ids: list[str]
+    expected_points: float
+    expected_projected: float
+    attribute_ids: list[str] | None = None
 
-@pytest.fixture
-def sample_repository(tmp_path):
-    """Create test repository."""
-    # Create .git directory for Repository validation
-    (tmp_path / ".git").mkdir()
-
-    return Repository(
-        path=tmp_path,
-        name="test-repo",
-        url=None,
-        branch="main",
-        commit_hash="abc123",
-        languages={"Python": 100},
-        total_files=10,
-        total_lines=500,
-    )
+
+@pytest.fixture(scope="session")
+def sample_repository():
+    """Create test repository (shared read-only across the session)."""
+    # Skip the path/.git validation; these tests never touch the repository on disk
+    with patch.object(Repository, "__post_init__"):
+        return Repository(
+            path=Path("/fake/test-repo"),
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 100},
+            total_files=10,
+            total_lines=500,
+        )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_attribute():
     """Create test attribute."""
     return Attribute(
@@ -71,7 +71,7 @@ def sample_attribute():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def failing_finding(sample_attribute):
     """Create failing finding."""
     return Finding(
@@ -86,7 +86,7 @@ def failing_finding(sample_attribute):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def passing_finding(sample_attribute):
     """Create passing finding."""
     return Finding(
@@ -102,393 +102,271 @@ def passing_finding(sample_attribute):
 
 
 @pytest.fixture
-def sample_assessment(sample_repository, failing_finding):
-    """Create assessment with failing finding."""
-    return Assessment(
-        repository=sample_repository,
-        timestamp=datetime.now(),
-        overall_score=50.0,
-        certification_level="Needs Improvement",
-        attributes_assessed=1,
-        attributes_not_assessed=0,
-        attributes_total=1,
-        findings=[failing_finding],
-        config=None,
-        duration_seconds=1.0,
-    )
-
-
-class TestFixerService:
-    """Test FixerService class."""
+def make_fixer():
+    """Factory for BaseFixer mocks that fix (or decline) a single attribute."""
 
-    def test_init_with_default_fixers(self):
-        """Test initialization with default fixers."""
-        service = FixerService()
-        assert len(service.fixers) > 0
-        # Should have CLAUDEmdFixer, GitignoreFixer, PrecommitHooksFixer
-        assert len(service.fixers) == 3
-
-    def test_generate_fix_plan_with_failing_finding(
-        self, sample_assessment, sample_repository
-    ):
-        """Test generating fix plan for failing finding."""
-        service = FixerService()
-        # Add a mock fixer that can fix our test attribute
-        mock_fixer = MockFixer("test_attr", can_fix_result=True)
-        service.fixers.append(mock_fixer)
-
-        plan = service.generate_fix_plan(sample_assessment, sample_repository)
-
-        assert isinstance(plan, FixPlan)
-        assert plan.current_score == 50.0
-        assert plan.projected_score > plan.current_score
-        assert plan.points_gained > 0
-        assert len(plan.fixes) == 1
-
-    def test_generate_fix_plan_no_failing_findings(self, sample_repository):
-        """Test generating fix plan with no failing findings."""
-        # Create a passing finding
-        passing_attr = Attribute(
-            id="test_pass",
-            name="Test Pass",
-            category="Test",
-            tier=1,
-            description="Test attribute",
-            criteria="Pass",
-            default_weight=1.0,
-        )
-        passing_finding = Finding(
-            attribute=passing_attr,
-            status="pass",
-            score=100.0,
-            measured_value="good",
-            threshold="good",
-            evidence=["All tests pass"],
-            remediation=None,
-            error_message=None,
+    def _generate_fix(repository, finding):
+        return FileCreationFix(
+            attribute_id=finding.attribute.id,
+            description=f"Fix for {finding.attribute.id}",
+            points_gained=10.0,
+            file_path=Path("test.txt"),
+            content="test content",
+            repository_path=repository.path,
         )
 
-        assessment = Assessment(
-            repository=sample_repository,
-            timestamp=datetime.now(),
-            overall_score=100.0,
-            certification_level="Platinum",
-            attributes_assessed=1,
-            attributes_not_assessed=0,
-            attributes_total=1,
-            findings=[passing_finding],
-            config=None,
-            duration_seconds=1.0,
+    def _make_fixer(attr_id: str, can_fix: bool = True) -> Mock:
+        return Mock(
+            spec=BaseFixer,
+            attribute_id=attr_id,
+            can_fix=Mock(return_value=can_fix),
+            generate_fix=Mock(side_effect=_generate_fix),
         )
 
-        service = FixerService()
-        plan = service.generate_fix_plan(assessment, sample_repository)
+    return _make_fixer
 
-        assert len(plan.fixes) == 0
-        assert plan.points_gained == 0
-        assert plan.projected_score == plan.current_score
-
-    def test_generate_fix_plan_filters_by_attribute_ids(
-        self, sample_repository, sample_attribute
-    ):
-        """Test generating fix plan filtered by attribute IDs."""
-        # Create two failing findings
-        finding1 = Finding(
-            attribute=sample_attribute,
-            status="fail",
-            score=0.0,
-            measured_value="missing",
-            threshold="present",
-            evidence=["Missing"],
-            remediation=None,
-            error_message=None,
-        )
-
-        attr2 = Attribute(
-            id="other_attr",
-            name="Other Attribute",
-            category="Testing",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.1,
-        )
-        finding2 = Finding(
-            attribute=attr2,
-            status="fail",
-            score=0.0,
-            measured_value="missing",
-            threshold="present",
-            evidence=["Missing"],
-            remediation=None,
-            error_message=None,
-        )
 
-        assessment = Assessment(
-            repository=sample_repository,
-            timestamp=datetime.now(),
-            overall_score=50.0,
-            certification_level="Needs Improvement",
-            attributes_assessed=2,
-            attributes_not_assessed=0,
-            attributes_total=2,
-            findings=[finding1, finding2],
-            config=None,
-            duration_seconds=1.0,
-        )
+@pytest.fixture
+def service():
+    """Fresh FixerService (default fixers are cached by the service module)."""
+    return FixerService()
 
-        service = FixerService()
-        # Add fixers for both attributes
-        service.fixers.append(MockFixer("test_attr"))
-        service.fixers.append(MockFixer("other_attr"))
 
-        # Generate plan for only test_attr
-        plan = service.generate_fix_plan(
-            assessment, sample_repository, attribute_ids=["test_attr"]
-        )
+class TestFixerService:
+    """Test FixerService class."""
 
-        # Should only have fix for test_attr
-        assert len(plan.fixes) == 1
-        assert plan.fixes[0].attribute_id == "test_attr"
+    def test_init_with_default_fixers(self, service):
+        """Test initialization with default fixers."""
+        assert len(service.fixers) > 0
+        # Should have CLAUDEmdFixer, GitignoreFixer, PrecommitHooksFixer
+        assert len(service.fixers) == 3
 
-    def test_generate_fix_plan_score_projection(
-        self, sample_assessment, sample_repository
+    @pytest.mark.parametrize(
+        "case",
+        [
+            pytest.param(
+                FixPlanCase(
+                    overall_score=50.0,
+                    findings=[("test_attr", "fail")],
+                    fixers=[("test_attr", True)],
+                    expected_fix_ids=["test_attr"],
+                    expected_points=10.0,
+                    expected_projected=60.0,
+                ),
+                id="failing_finding",
+            ),
+            pytest.param(
+                FixPlanCase(
+                    overall_score=100.0,
+                    findings=[("test_pass", "pass")],
+                    fixers=[],
+                    expected_fix_ids=[],
+                    expected_points=0.0,
+                    expected_projected=100.0,
+                ),
+                id="no_failing_findings",
+            ),
+            pytest.param(
+                FixPlanCase(
+                    overall_score=50.0,
+                    findings=[("test_attr", "fail"), ("other_attr", "fail")],
+                    fixers=[("test_attr", True), ("other_attr", True)],
+                    attribute_ids=["test_attr"],
+                    expected_fix_ids=["test_attr"],
+                    expected_points=10.0,
+                    expected_projected=60.0,
+                ),
+                id="filters_by_attribute_ids",
+            ),
+            pytest.param(
+                FixPlanCase(
+                    overall_score=95.0,
+                    findings=[("test_attr", "fail")],
+                    fixers=[("test_attr", True)],
+                    expected_fix_ids=["test_attr"],
+                    expected_points=10.0,
+                    expected_projected=100.0,
+                ),
+                id="caps_at_100",
+            ),
+            pytest.param(
+                FixPlanCase(
+                    overall_score=50.0,
+                    findings=[("test_attr", "fail")],
+                    fixers=[("test_attr", False)],
+                    expected_fix_ids=[],
+                    expected_points=0.0,
+                    expected_projected=50.0,
+                ),
+                id="non_fixable_finding",
+            ),
+            pytest.param(
+                FixPlanCase(
+                    overall_score=50.0,
+                    findings=[("test_attr", "fail")],
+                    fixers=[],
+                    expected_fix_ids=[],
+                    expected_points=0.0,
+                    expected_projected=50.0,
+                ),
+                id="no_matching_fixer",
+            ),
+        ],
+    )
+    def test_generate_fix_plan(
+        self,
+        service,
+        sample_repository,
+        sample_attribute,
+        failing_finding,
+        passing_finding,
+        make_fixer,
+        case,
     ):
-        """Test score projection calculation."""
-        service = FixerService()
-        mock_fixer = MockFixer("test_attr")
-        service.fixers.append(mock_fixer)
-
-        plan = service.generate_fix_plan(sample_assessment, sample_repository)
-
-        # Projected score should be current + points gained
-        expected_projected = min(100.0, sample_assessment.overall_score + 10.0)
-        assert plan.projected_score == expected_projected
-        assert plan.points_gained == 10.0
-
-    def test_generate_fix_plan_caps_at_100(self, sample_repository, sample_attribute):
-        """Test that projected score is capped at 100."""
-        finding = Finding(
-            attribute=sample_attribute,
-            status="fail",
-            score=0.0,
-            measured_value="missing",
-            threshold="present",
-            evidence=["Missing"],
-            remediation=None,
-            error_message=None,
-        )
-
+        """Test fix plan generation, filtering and score projection."""
+        # Derive findings from the shared templates, swapping only the attribute
+        templates = {"fail": failing_finding, "pass": passing_finding}
+        findings = [
+            replace(templates[status], attribute=replace(sample_attribute, id=attr_id))
+            for attr_id, status in case.findings
+        ]
         assessment = Assessment(
             repository=sample_repository,
-            timestamp=datetime.now(),
-            overall_score=95.0,  # High score
-            certification_level="Platinum",
-            attributes_assessed=1,
+            timestamp=FIXED_TIMESTAMP,
+            overall_score=case.overall_score,
+            certification_level=(
+                "Platinum" if case.overall_score >= 90 else "Needs Improvement"
+            ),
+            attributes_assessed=len(findings),
             attributes_not_assessed=0,
-            attributes_total=1,
-            findings=[finding],
+            attributes_total=len(findings),
+            findings=findings,
             config=None,
             duration_seconds=1.0,
         )
+        for attr_id, can_fix in case.fixers:
+            service.register(make_fixer(attr_id, can_fix=can_fix))
 
-        service = FixerService()
-        mock_fixer = MockFixer("test_attr")
-        service.fixers.append(mock_fixer)
-
-        plan = service.generate_fix_plan(assessment, sample_repository)
-
-        # Should be capped at 100
-        assert plan.projected_score == 100.0
-
-    def test_apply_fixes_success(self, tmp_path):
-        """Test applying fixes successfully."""
-        fix = FileCreationFix(
-            attribute_id="test_attr",
-            description="Create test file",
-            points_gained=10.0,
-            file_path=Path("test.txt"),
-            content="test content",
-            repository_path=tmp_path,
-        )
-
-        service = FixerService()
-        results = service.apply_fixes([fix])
-
-        assert results["succeeded"] == 1
-        assert results["failed"] == 0
-        assert len(results["failures"]) == 0
-        assert (tmp_path / "test.txt").exists()
-
-    def test_apply_fixes_dry_run(self, tmp_path):
-        """Test applying fixes in dry run mode."""
-        fix = FileCreationFix(
-            attribute_id="test_attr",
-            description="Create test file",
-            points_gained=10.0,
-            file_path=Path("test.txt"),
-            content="test content",
-            repository_path=tmp_path,
-        )
-
-        service = FixerService()
-        results = service.apply_fixes([fix], dry_run=True)
-
-        assert results["succeeded"] == 1
-        assert results["failed"] == 0
-        # File should NOT exist in dry run
-        assert not (tmp_path / "test.txt").exists()
-
-    def test_apply_fixes_failure(self, tmp_path):
-        """Test applying fixes that fail."""
-        # Create fix that will fail (file already exists)
-        test_file = tmp_path / "existing.txt"
-        test_file.write_text("existing content")
-
-        fix = FileCreationFix(
-            attribute_id="test_attr",
-            description="Create existing file",
-            points_gained=10.0,
-            file_path=Path("existing.txt"),
-            content="new content",
-            repository_path=tmp_path,
-        )
-
-        service = FixerService()
-        results = service.apply_fixes([fix])
-
-        assert results["succeeded"] == 0
-        assert results["failed"] == 1
-        assert len(results["failures"]) == 1
-        assert "Create existing file" in results["failures"][0]
-
-    def test_apply_fixes_exception_handling(self, tmp_path):
-        """Test that exceptions during fix application are handled."""
-
-        class FailingFix(FileCreationFix):
-            def apply(self, dry_run=False):
-                raise RuntimeError("Intentional failure")
-
-        fix = FailingFix(
-            attribute_id="test_attr",
-            description="Failing fix",
-            points_gained=10.0,
-            file_path=Path("test.txt"),
-            content="content",
-            repository_path=tmp_path,
+        plan = service.generate_fix_plan(
+            assessment, sample_repository, attribute_ids=case.attribute_ids
         )
 
-        service = FixerService()
-        results = service.apply_fixes([fix])
-
-        assert results["succeeded"] == 0
-        assert results["failed"] == 1
-        assert len(results["failures"]) == 1
-        assert "Intentional failure" in results["failures"][0]
-
-    def test_apply_multiple_fixes(self, tmp_path):
-        """Test applying multiple fixes."""
-        fixes = [
-            FileCreationFix(
-                attribute_id="test_attr_1",
-                description="Create file 1",
-                points_gained=5.0,
-                file_path=Path("file1.txt"),
-                content="content 1",
-                repository_path=tmp_path,
+        assert isinstance(plan, FixPlan)
+        assert [fix.attribute_id for fix in plan.fixes] == case.expected_fix_ids
+        assert plan.current_score == case.overall_score
+        assert plan.points_gained == case.expected_points
+        assert plan.projected_score == case.expected_projected
+
+    @pytest.mark.parametrize(
+        (
+            "fix_specs",
+            "pre_existing",
+            "dry_run",
+            "expected_succeeded",
+            "expected_failed",
+            "failure_text",
+        ),
+        [
+            pytest.param(
+                [(FileCreationFix, "test.txt")], [], False, 1, 0, None, id="success"
             ),
-            FileCreationFix(
-                attribute_id="test_attr_2",
-                description="Create file 2",
-                points_gained=5.0,
-                file_path=Path("file2.txt"),
-                content="content 2",
-                repository_path=tmp_path,
+            pytest.param(
+                [(FileCreationFix, "test.txt")], [], True, 1, 0, None, id="dry_run"
             ),
-        ]
-
-        service = FixerService()
-        results = service.apply_fixes(fixes)
-
-        assert results["succeeded"] == 2
-        assert results["failed"] == 0
-        assert (tmp_path / "file1.txt").exists()
-        assert (tmp_path / "file2.txt").exists()
-
-    def test_apply_mixed_success_and_failure(self, tmp_path):
-        """Test applying fixes with mixed success and failure."""
-        # Create one file that already exists
-        (tmp_path / "existing.txt").write_text("existing")
+            pytest.param(
+                [(FileCreationFix, "existing.txt")],
+                ["existing.txt"],
+                False,
+                0,
+                1,
+                "Create existing.txt",
+                id="failure",
+            ),
+            pytest.param(
+                [(FailingFix, "test.txt")],
+                [],
+                False,
+                0,
+                1,
+                "Intentional failure",
+                id="exception_handling",
+            ),
+            pytest.param(
+                [(FileCreationFix, "file1.txt"), (FileCreationFix, "file2.txt")],
+                [],
+                False,
+                2,
+                0,
+                None,
+                id="multiple",
+            ),
+            pytest.param(
+                [(FileCreationFix, "new.txt"), (FileCreationFix, "existing.txt")],
+                ["existing.txt"],
+                False,
+                1,
+                1,
+                "Create existing.txt",
+                id="mixed_success_and_failure",
+            ),
+        ],
+    )
+    def test_apply_fixes(
+        self,
+        service,
+        fs,
+        fix_specs,
+        pre_existing,
+        dry_run,
+        expected_succeeded,
+        expected_failed,
+        failure_text,
+    ):
+        """Test applying fixes across success, dry-run and failure scenarios."""
+        # pyfakefs keeps all file I/O from FileCreationFix.apply in memory
+        repo_path = Path("/repo")
+        fs.create_dir(repo_path)
+        for name in pre_existing:
+            (repo_path / name).write_text("existing content")
 
         fixes = [
-            FileCreationFix(
-                attribute_id="test_attr_1",
-                description="Create new file",
+            fix_cls(
+                attribute_id=f"test_attr_{i}",
+                description=f"Create {name}",
                 points_gained=5.0,
-                file_path=Path("new.txt"),
+                file_path=Path(name),
                 content="content",
-                repository_path=tmp_path,
-            ),
-            FileCreationFix(
-                attribute_id="test_attr_2",
-                description="Create existing file",
-                points_gained=5.0,
-                file_path=Path("existing.txt"),
-                content="content",
-                repository_path=tmp_path,
-            ),
+                repository_path=repo_path,
+            )
+            for i, (fix_cls, name) in enumerate(fix_specs)
         ]
 
-        service = FixerService()
-        results = service.apply_fixes(fixes)
+        results = service.apply_fixes(fixes, dry_run=dry_run)
+
+        assert results["succeeded"] == expected_succeeded
+        assert results["failed"] == expected_failed
+        assert len(results["failures"]) == expected_failed
+        if failure_text:
+            assert failure_text in results["failures"][0]
 
-        assert results["succeeded"] == 1
-        assert results["failed"] == 1
-        assert len(results["failures"]) == 1
+        # Newly created files exist only when not in dry-run mode
+        for fix_cls, name in fix_specs:
+            if fix_cls is FileCreationFix and name not in pre_existing:
+                assert (repo_path / name).exists() is not dry_run
 
-    def test_find_fixer_existing(self):
+    def test_find_fixer_existing(self, service, make_fixer):
         """Test finding fixer for existing attribute."""
-        service = FixerService()
-        mock_fixer = MockFixer("test_attr")
-        service.fixers.append(mock_fixer)
+        mock_fixer = make_fixer("test_attr")
+        service.register(mock_fixer)
 
         found = service._find_fixer("test_attr")
         assert found is mock_fixer
 
-    def test_find_fixer_nonexistent(self):
+    def test_find_fixer_nonexistent(self, service):
         """Test finding fixer for non-existent attribute."""
-        service = FixerService()
         found = service._find_fixer("nonexistent_attr")
         assert found is None
 
-    def test_generate_fix_plan_with_non_fixable_finding(
-        self, sample_assessment, sample_repository
-    ):
-        """Test generating fix plan when fixer can't fix the finding."""
-        service = FixerService()
-        # Add a mock fixer that returns False for can_fix
-        mock_fixer = MockFixer("test_attr", can_fix_result=False)
-        service.fixers.append(mock_fixer)
-
-        plan = service.generate_fix_plan(sample_assessment, sample_repository)
-
-        # Should have no fixes since can_fix returns False
-        assert len(plan.fixes) == 0
-        assert plan.points_gained == 0
-
-    def test_generate_fix_plan_with_no_matching_fixer(
-        self, sample_assessment, sample_repository
-    ):
-        """Test generating fix plan when no fixer matches the attribute."""
-        service = FixerService()
-        # Don't add any fixer for test_attr
-
-        plan = service.generate_fix_plan(sample_assessment, sample_repository)
-
-        # Should have no fixes since no fixer is registered
-        assert len(plan.fixes) == 0
-        assert plan.points_gained == 0
-
 
 class TestFixPlan:
     """Test FixPlan dataclass."""
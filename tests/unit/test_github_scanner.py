@@ -1,490 +1,312 @@
 """Unit tests for GitHub organization scanner."""
 
-from unittest.mock import Mock, patch
+import logging
+from functools import cache
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 import requests
 
+from agentready.services import github_scanner
 from agentready.services.github_scanner import (
     GitHubAPIError,
     GitHubAuthError,
     GitHubOrgScanner,
 )
 
+# Well-formed personal access token: "ghp_" followed by 36 characters
+VALID_TOKEN = "ghp_" + "a" * 36
 
-def test_missing_token():
-    """Test that missing token raises error."""
-    with patch.dict("os.environ", {}, clear=True):
-        with pytest.raises(GitHubAuthError, match="GITHUB_TOKEN"):
-            GitHubOrgScanner()
-
-
-def test_invalid_token_format():
-    """Test that invalid token format raises error."""
-    with patch.dict("os.environ", {"GITHUB_TOKEN": "invalid_token"}):
-        with pytest.raises(GitHubAuthError, match="Invalid GitHub token format"):
-            GitHubOrgScanner()
-
-
-def test_valid_token_format():
-    """Test that valid token format is accepted."""
-    token = "ghp_" + "a" * 36
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        assert scanner.token == token
-
-
-def test_invalid_org_name():
-    """Test that invalid org name raises error."""
-    token = "ghp_" + "a" * 36
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-
-        # Test various invalid org names
-        invalid_names = [
-            "invalid org name!",  # Spaces
-            "org/name",  # Slashes
-            "org@name",  # Special characters
-            "a" * 40,  # Too long
-            "",  # Empty
-        ]
-
-        for invalid_name in invalid_names:
-            with pytest.raises(ValueError, match="Invalid organization name"):
-                scanner.get_org_repos(invalid_name)
-
-
-def test_valid_org_names():
-    """Test that valid org names are accepted."""
-    token = "ghp_" + "a" * 36
-
-    valid_names = [
-        "github",
-        "anthropics",
-        "my-org",
-        "org123",
-        "a",  # Single character
-        "a" * 39,  # Max length
-    ]
-
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-
-        with patch("requests.get") as mock_get:
-            # Mock empty response (no repos)
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = []
-            mock_response.headers = {"X-RateLimit-Remaining": "5000"}
-            mock_get.return_value = mock_response
-
-            for valid_name in valid_names:
-                # Should not raise
-                repos = scanner.get_org_repos(valid_name)
-                assert repos == []
-
+INVALID_ORG_NAMES = (
+    "invalid org name!",  # Spaces
+    "org/name",  # Slashes
+    "org@name",  # Special characters
+    "a" * 40,  # Too long
+    "",  # Empty
+)
 
-def test_token_redaction():
-    """Test that token is redacted in error messages."""
-    token = "ghp_" + "a" * 36
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-
-        # Test redaction
-        text = f"Error with token {token}"
-        redacted = scanner._redact_token(text)
-        assert token not in redacted
-        assert "[REDACTED]" in redacted
-
-        # Test no change if token not present
-        text_without_token = "Error without token"
-        assert scanner._redact_token(text_without_token) == text_without_token
-
-
-@patch("requests.get")
-def test_successful_org_scan(mock_get):
-    """Test successful organization scan."""
-    token = "ghp_" + "a" * 36
-
-    # Mock API responses - first page returns repos, second page returns empty (pagination complete)
-    mock_response_page1 = Mock()
-    mock_response_page1.status_code = 200
-    mock_response_page1.json.return_value = [
-        {
-            "name": "repo1",
-            "clone_url": "https://github.com/org/repo1.git",
-            "private": False,
-            "archived": False,
-        },
-        {
-            "name": "repo2",
-            "clone_url": "https://github.com/org/repo2.git",
-            "private": False,
-            "archived": False,
-        },
-    ]
-    mock_response_page1.headers = {"X-RateLimit-Remaining": "5000"}
-
-    mock_response_page2 = Mock()
-    mock_response_page2.status_code = 200
-    mock_response_page2.json.return_value = []  # Empty - end of pagination
-    mock_response_page2.headers = {"X-RateLimit-Remaining": "5000"}
-
-    mock_get.side_effect = [mock_response_page1, mock_response_page2]
-
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        repos = scanner.get_org_repos("testorg")
-
-        assert len(repos) == 2
-        assert "https://github.com/org/repo1.git" in repos
-        assert "https://github.com/org/repo2.git" in repos
-
-
-@patch("requests.get")
-def test_filters_private_repos(mock_get):
-    """Test that private repos are filtered by default."""
-    token = "ghp_" + "a" * 36
-
-    # Mock API responses - first page returns repos, second page returns empty
-    mock_response_page1 = Mock()
-    mock_response_page1.status_code = 200
-    mock_response_page1.json.return_value = [
-        {
-            "name": "public-repo",
-            "clone_url": "https://github.com/org/public.git",
-            "private": False,
-            "archived": False,
-        },
-        {
-            "name": "private-repo",
-            "clone_url": "https://github.com/org/private.git",
-            "private": True,
-            "archived": False,
-        },
-    ]
-    mock_response_page1.headers = {"X-RateLimit-Remaining": "5000"}
-
-    mock_response_page2 = Mock()
-    mock_response_page2.status_code = 200
-    mock_response_page2.json.return_value = []  # Empty - end of pagination
-    mock_response_page2.headers = {"X-RateLimit-Remaining": "5000"}
-
-    mock_get.side_effect = [mock_response_page1, mock_response_page2]
-
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        repos = scanner.get_org_repos("testorg", include_private=False)
-
-        assert len(repos) == 1
-        assert "https://github.com/org/public.git" in repos
-
-
-@patch("requests.get")
-def test_includes_private_repos_when_requested(mock_get):
-    """Test that private repos are included when requested."""
-    token = "ghp_" + "a" * 36
-
-    # Mock API responses - first page returns repos, second page returns empty
-    mock_response_page1 = Mock()
-    mock_response_page1.status_code = 200
-    mock_response_page1.json.return_value = [
-        {
-            "name": "public-repo",
-            "clone_url": "https://github.com/org/public.git",
-            "private": False,
-            "archived": False,
-        },
-        {
-            "name": "private-repo",
-            "clone_url": "https://github.com/org/private.git",
-            "private": True,
-            "archived": False,
-        },
-    ]
-    mock_response_page1.headers = {"X-RateLimit-Remaining": "5000"}
-
-    mock_response_page2 = Mock()
-    mock_response_page2.status_code = 200
-    mock_response_page2.json.return_value = []  # Empty - end of pagination
-    mock_response_page2.headers = {"X-RateLimit-Remaining": "5000"}
-
-    mock_get.side_effect = [mock_response_page1, mock_response_page2]
-
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        repos = scanner.get_org_repos("testorg", include_private=True)
-
-        assert len(repos) == 2
-        assert "https://github.com/org/public.git" in repos
-        assert "https://github.com/org/private.git" in repos
-
-
-@patch("requests.get")
-def test_filters_archived_repos(mock_get):
-    """Test that archived repos are always filtered."""
-    token = "ghp_" + "a" * 36
-
-    # Mock API responses - first page returns repos, second page returns empty
-    mock_response_page1 = Mock()
-    mock_response_page1.status_code = 200
-    mock_response_page1.json.return_value = [
-        {
-            "name": "active-repo",
-            "clone_url": "https://github.com/org/active.git",
-            "private": False,
-            "archived": False,
-        },
-        {
-            "name": "archived-repo",
-            "clone_url": "https://github.com/org/archived.git",
-            "private": False,
-            "archived": True,
-        },
-    ]
-    mock_response_page1.headers = {"X-RateLimit-Remaining": "5000"}
+VALID_ORG_NAMES = (
+    "github",
+    "anthropics",
+    "my-org",
+    "org123",
+    "a",  # Single character
+    "a" * 39,  # Max length
+)
 
-    mock_response_page2 = Mock()
-    mock_response_page2.status_code = 200
-    mock_response_page2.json.return_value = []  # Empty - end of pagination
-    mock_response_page2.headers = {"X-RateLimit-Remaining": "5000"}
+# Shared read-only rate-limit headers (plenty remaining / below warning threshold)
+DEFAULT_HEADERS = MappingProxyType({"X-RateLimit-Remaining": "5000"})
+LOW_RL_HEADERS = MappingProxyType({"X-RateLimit-Remaining": "5"})
 
-    mock_get.side_effect = [mock_response_page1, mock_response_page2]
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        repos = scanner.get_org_repos("testorg")
+def _gh_response(json_data=(), status=200, headers=DEFAULT_HEADERS, text=""):
+    """Build a lightweight stand-in for a GitHub API ``requests.Response``.
 
-        assert len(repos) == 1
-        assert "https://github.com/org/active.git" in repos
+    ``json_data`` may be an exception instance, in which case ``json()`` raises it.
+    Status codes >= 400 make ``raise_for_status()`` raise ``requests.HTTPError``.
+    """
 
+    def json():
+        if isinstance(json_data, Exception):
+            raise json_data
+        return json_data
 
-@patch("requests.get")
-def test_respects_max_repos_limit(mock_get):
-    """Test that max_repos limit is enforced."""
-    token = "ghp_" + "a" * 36
-
-    # Return 150 repos in one batch
-    mock_repos = [
-        {
-            "name": f"repo{i}",
-            "clone_url": f"https://github.com/org/repo{i}.git",
-            "private": False,
-            "archived": False,
-        }
-        for i in range(150)
-    ]
+    def raise_for_status():
+        if status >= 400:
+            raise requests.HTTPError(f"{status} Error")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = mock_repos
-    mock_response.headers = {"X-RateLimit-Remaining": "5000"}
-    mock_get.return_value = mock_response
+    return SimpleNamespace(
+        status_code=status,
+        json=json,
+        headers=headers,
+        raise_for_status=raise_for_status,
+        text=text,
+    )
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        repos = scanner.get_org_repos("testorg", max_repos=10)
 
-        assert len(repos) == 10
+def _repo(name, private=False, archived=False):
+    """Build a repository entry as returned by the GitHub org repos API."""
+    return {
+        "name": name,
+        "clone_url": f"https://github.com/org/{name}.git",
+        "private": private,
+        "archived": archived,
+    }
 
 
-@patch("requests.get")
-def test_pagination(mock_get):
-    """Test that pagination works correctly."""
-    token = "ghp_" + "a" * 36
-
-    # First page: 100 repos
-    page1_repos = [
-        {
-            "name": f"repo{i}",
-            "clone_url": f"https://github.com/org/repo{i}.git",
-            "private": False,
-            "archived": False,
-        }
-        for i in range(100)
-    ]
+@cache
+def _make_repos(count):
+    """Public, active repos repo0..repo<count-1>, built once per count."""
+    return tuple(_repo(f"repo{i}") for i in range(count))
 
-    # Second page: 50 repos
-    page2_repos = [
-        {
-            "name": f"repo{i}",
-            "clone_url": f"https://github.com/org/repo{i}.git",
-            "private": False,
-            "archived": False,
-        }
-        for i in range(100, 150)
-    ]
 
-    # Third page: empty (no more repos)
-    page3_repos = []
+# Shared pagination terminator (an empty page ends the scan)
+EMPTY_PAGE = _gh_response([])
 
-    responses = [page1_repos, page2_repos, page3_repos]
-    call_count = [0]
+# Full first page and partial second page of a 150-repo organization
+PAGE1 = _gh_response(_make_repos(150)[:100])
+PAGE2 = _gh_response(_make_repos(150)[100:])
 
-    def mock_get_side_effect(*args, **kwargs):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = responses[call_count[0]]
-        mock_response.headers = {"X-RateLimit-Remaining": "5000"}
-        call_count[0] += 1
-        return mock_response
 
-    mock_get.side_effect = mock_get_side_effect
+@pytest.fixture(scope="module")
+def scanner():
+    """Scanner built once per module with a valid GITHUB_TOKEN in the environment."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GITHUB_TOKEN", VALID_TOKEN)
+        yield GitHubOrgScanner()
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        repos = scanner.get_org_repos("testorg", max_repos=200)
 
-        # Should get all 150 repos (stopped at empty page)
-        assert len(repos) == 150
+@pytest.fixture
+def mock_get(monkeypatch):
+    """Replace requests.get for the scanner module and skip its inter-page sleep."""
+    m = MagicMock()
+    monkeypatch.setattr("agentready.services.github_scanner.requests.get", m)
+    monkeypatch.setattr(
+        github_scanner, "time", SimpleNamespace(sleep=lambda seconds: None)
+    )
+    return m
 
 
-@patch("requests.get")
-def test_handles_404_org_not_found(mock_get):
-    """Test handling of 404 (org not found)."""
-    token = "ghp_" + "a" * 36
+@pytest.fixture(scope="module")
+def big_page():
+    """Single page with one repo more than a max_repos=10 limit."""
+    return _gh_response(_make_repos(11))
 
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.raise_for_status.side_effect = requests.HTTPError()
-    mock_get.return_value = mock_response
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        with pytest.raises(GitHubAPIError, match="Organization not found"):
-            scanner.get_org_repos("nonexistent")
+def test_missing_token(monkeypatch):
+    """Test that missing token raises error."""
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    with pytest.raises(GitHubAuthError, match="GITHUB_TOKEN"):
+        GitHubOrgScanner()
 
 
-@patch("requests.get")
-def test_handles_401_auth_failed(mock_get):
-    """Test handling of 401 (authentication failed)."""
-    token = "ghp_" + "a" * 36
+def test_invalid_token_format(monkeypatch):
+    """Test that invalid token format raises error."""
+    monkeypatch.setenv("GITHUB_TOKEN", "invalid_token")
+    with pytest.raises(GitHubAuthError, match="Invalid GitHub token format"):
+        GitHubOrgScanner()
 
-    mock_response = Mock()
-    mock_response.status_code = 401
-    mock_response.raise_for_status.side_effect = requests.HTTPError()
-    mock_get.return_value = mock_response
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        with pytest.raises(GitHubAuthError, match="authentication failed"):
-            scanner.get_org_repos("testorg")
+def test_valid_token_format(monkeypatch):
+    """Test that valid token format is accepted."""
+    monkeypatch.setenv("GITHUB_TOKEN", VALID_TOKEN)
+    scanner = GitHubOrgScanner()
+    assert scanner.token == VALID_TOKEN
 
 
-@patch("requests.get")
-def test_handles_403_rate_limit(mock_get):
-    """Test handling of 403 (rate limit exceeded)."""
-    token = "ghp_" + "a" * 36
+@pytest.mark.parametrize("invalid_name", INVALID_ORG_NAMES)
+def test_invalid_org_name(scanner, invalid_name):
+    """Test that invalid org name raises error."""
+    with pytest.raises(ValueError, match="Invalid organization name"):
+        scanner.get_org_repos(invalid_name)
 
-    mock_response = Mock()
-    mock_response.status_code = 403
-    mock_response.text = "API rate limit exceeded for user"
-    mock_response.raise_for_status.side_effect = requests.HTTPError()
-    mock_get.return_value = mock_response
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        with pytest.raises(GitHubAPIError, match="rate limit exceeded"):
-            scanner.get_org_repos("testorg")
+@pytest.mark.parametrize("valid_name", VALID_ORG_NAMES)
+def test_valid_org_names(mock_get, scanner, valid_name):
+    """Test that valid org names are accepted."""
+    # Mock empty response (no repos)
+    mock_get.return_value = EMPTY_PAGE
 
+    # Should not raise
+    assert scanner.get_org_repos(valid_name) == []
 
-@patch("requests.get")
-def test_handles_403_authorization_failed(mock_get):
-    """Test handling of 403 (authorization failed, not rate limit)."""
-    token = "ghp_" + "a" * 36
 
-    mock_response = Mock()
-    mock_response.status_code = 403
-    mock_response.text = "Forbidden: insufficient permissions"
-    mock_response.raise_for_status.side_effect = requests.HTTPError()
-    mock_get.return_value = mock_response
+def test_token_redaction(scanner):
+    """Test that token is redacted in error messages."""
+    # Test redaction
+    text = f"Error with token {VALID_TOKEN}"
+    redacted = scanner._redact_token(text)
+    assert VALID_TOKEN not in redacted
+    assert "[REDACTED]" in redacted
+
+    # Test no change if token not present
+    text_without_token = "Error without token"
+    assert scanner._redact_token(text_without_token) == text_without_token
+
+
+@pytest.mark.parametrize(
+    ("repos", "include_private", "expected_urls"),
+    [
+        pytest.param(
+            [_repo("repo1"), _repo("repo2")],
+            False,
+            {"https://github.com/org/repo1.git", "https://github.com/org/repo2.git"},
+            id="all_public",
+        ),
+        pytest.param(
+            [_repo("public"), _repo("private", private=True)],
+            False,
+            {"https://github.com/org/public.git"},
+            id="filters_private",
+        ),
+        pytest.param(
+            [_repo("public"), _repo("private", private=True)],
+            True,
+            {"https://github.com/org/public.git", "https://github.com/org/private.git"},
+            id="includes_private_when_requested",
+        ),
+        pytest.param(
+            [_repo("active"), _repo("archived", archived=True)],
+            False,
+            {"https://github.com/org/active.git"},
+            id="filters_archived",
+        ),
+        pytest.param(
+            [_repo("private", private=True), _repo("old", private=True, archived=True)],
+            True,
+            {"https://github.com/org/private.git"},
+            id="filters_archived_when_including_private",
+        ),
+    ],
+)
+def test_repo_filtering(mock_get, scanner, repos, include_private, expected_urls):
+    """Test that private repos are opt-in and archived repos are always filtered."""
+    # First page returns repos, second page is empty (pagination complete)
+    mock_get.side_effect = [_gh_response(repos), EMPTY_PAGE]
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        with pytest.raises(GitHubAuthError, match="authorization failed"):
-            scanner.get_org_repos("testorg")
+    result = scanner.get_org_repos("testorg", include_private=include_private)
 
+    assert len(result) == len(expected_urls)
+    assert set(result) == expected_urls
 
-@patch("requests.get")
-def test_handles_timeout(mock_get):
-    """Test handling of request timeout."""
-    token = "ghp_" + "a" * 36
 
-    mock_get.side_effect = requests.Timeout()
+def test_respects_max_repos_limit(mock_get, scanner, big_page):
+    """Test that max_repos limit is enforced."""
+    mock_get.return_value = big_page
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        with pytest.raises(GitHubAPIError, match="timeout"):
-            scanner.get_org_repos("testorg")
+    repos = scanner.get_org_repos("testorg", max_repos=10)
 
+    assert len(repos) == 10
 
-@patch("requests.get")
-def test_handles_invalid_json(mock_get):
-    """Test handling of invalid JSON response."""
-    token = "ghp_" + "a" * 36
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.side_effect = ValueError("Invalid JSON")
-    mock_get.return_value = mock_response
+def test_pagination(mock_get, scanner):
+    """Test that pagination works correctly."""
+    # Full first page (100 repos), partial second page (50), then empty
+    mock_get.side_effect = iter([PAGE1, PAGE2, EMPTY_PAGE])
+
+    repos = scanner.get_org_repos("testorg", max_repos=200)
+
+    # Should get all 150 repos (stopped at empty page)
+    assert len(repos) == 150
+
+
+@pytest.mark.parametrize(
+    ("outcome", "exc_type", "match"),
+    [
+        pytest.param(
+            _gh_response(status=404),
+            GitHubAPIError,
+            "Organization not found",
+            id="404_org_not_found",
+        ),
+        pytest.param(
+            _gh_response(status=401),
+            GitHubAuthError,
+            "authentication failed",
+            id="401_auth_failed",
+        ),
+        pytest.param(
+            _gh_response(status=403, text="API rate limit exceeded for user"),
+            GitHubAPIError,
+            "rate limit exceeded",
+            id="403_rate_limit",
+        ),
+        pytest.param(
+            _gh_response(status=403, text="Forbidden: insufficient permissions"),
+            GitHubAuthError,
+            "authorization failed",
+            id="403_authorization_failed",
+        ),
+        pytest.param(requests.Timeout(), GitHubAPIError, "timeout", id="timeout"),
+        pytest.param(
+            _gh_response(ValueError("Invalid JSON")),
+            GitHubAPIError,
+            "Invalid JSON",
+            id="invalid_json",
+        ),
+    ],
+)
+def test_handles_api_errors(mock_get, scanner, outcome, exc_type, match):
+    """Test that HTTP errors, timeouts and bad JSON map to scanner exceptions."""
+    # A one-item side_effect returns the response, or raises it if an exception
+    mock_get.side_effect = [outcome]
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        with pytest.raises(GitHubAPIError, match="Invalid JSON"):
-            scanner.get_org_repos("testorg")
+    with pytest.raises(exc_type, match=match):
+        scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
-def test_token_redacted_in_request_exception(mock_get):
+def test_token_redacted_in_request_exception(mock_get, scanner):
     """Test that token is redacted when RequestException contains it."""
-    token = "ghp_" + "a" * 36
-
     # Simulate error message containing token
-    mock_get.side_effect = requests.RequestException(f"Connection error with {token}")
+    mock_get.side_effect = requests.RequestException(
+        f"Connection error with {VALID_TOKEN}"
+    )
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        with pytest.raises(GitHubAPIError) as exc_info:
-            scanner.get_org_repos("testorg")
+    with pytest.raises(GitHubAPIError) as exc_info:
+        scanner.get_org_repos("testorg")
 
-        # Verify token is redacted in error message
-        error_msg = str(exc_info.value)
-        assert token not in error_msg
-        assert "[REDACTED]" in error_msg
+    # Verify token is redacted in error message
+    error_msg = str(exc_info.value)
+    assert VALID_TOKEN not in error_msg
+    assert "[REDACTED]" in error_msg
 
 
-@patch("requests.get")
-def test_rate_limit_warning(mock_get, caplog):
+def test_rate_limit_warning(mock_get, scanner, caplog):
     """Test that low rate limit triggers warning."""
-    token = "ghp_" + "a" * 36
-
     # Mock API responses - first page returns repos with low rate limit, second page returns empty
-    mock_response_page1 = Mock()
-    mock_response_page1.status_code = 200
-    mock_response_page1.json.return_value = [
-        {
-            "name": "repo1",
-            "clone_url": "https://github.com/org/repo1.git",
-            "private": False,
-            "archived": False,
-        }
+    mock_get.side_effect = [
+        _gh_response([_repo("repo1")], headers=LOW_RL_HEADERS),
+        _gh_response([], headers=LOW_RL_HEADERS),
     ]
-    # Low rate limit
-    mock_response_page1.headers = {"X-RateLimit-Remaining": "5"}
-
-    mock_response_page2 = Mock()
-    mock_response_page2.status_code = 200
-    mock_response_page2.json.return_value = []  # Empty - end of pagination
-    mock_response_page2.headers = {"X-RateLimit-Remaining": "5"}
-
-    mock_get.side_effect = [mock_response_page1, mock_response_page2]
+    caplog.set_level(logging.WARNING, logger=github_scanner.__name__)
 
-    with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-        scanner = GitHubOrgScanner()
-        repos = scanner.get_org_repos("testorg")
+    repos = scanner.get_org_repos("testorg")
 
-        assert len(repos) == 1
-        # Should have logged a warning about low rate limit
-        assert any(
-            "rate limit low" in record.message.lower() for record in caplog.records
-        )
+    assert len(repos) == 1
+    # Should have logged a warning about low rate limit
+    assert any(
+        "rate limit low" in record.message
+        for record in caplog.records
+        if record.levelno == logging.WARNING
+    )
@@ -1,16 +1,44 @@
 """Unit tests for learning service."""
 
 import json
-import subprocess
-import tempfile
+import os
+import shutil
 from pathlib import Path
-from unittest.mock import patch
+from types import MappingProxyType
+from unittest.mock import MagicMock
 
 import pytest
 
 from agentready.models import DiscoveredSkill
 from agentready.services.learning_service import LearningService
 
+# Shared DiscoveredSkill defaults; tests override only the fields they care about.
+# List fields are built per skill in _make_skill so instances never share them.
+_BASE_SKILL_KWARGS = MappingProxyType(
+    {
+        "skill_id": "test-skill",
+        "name": "Test Skill",
+        "description": "Test description",
+        "confidence": 95.0,
+        "source_attribute_id": "claude_md_file",
+        "reusability_score": 100.0,
+        "impact_score": 50.0,
+        "pattern_summary": "Test pattern",
+    }
+)
+
+
+def _make_skill(**overrides) -> DiscoveredSkill:
+    """Create a DiscoveredSkill from the shared defaults."""
+    return DiscoveredSkill(
+        **{
+            **_BASE_SKILL_KWARGS,
+            "code_examples": ["example"],
+            "citations": [],
+            **overrides,
+        }
+    )
+
 
 def create_dummy_finding() -> dict:
     """Create a dummy finding dict for testing (not_applicable status)."""
@@ -33,85 +61,84 @@ def create_dummy_finding() -> dict:
     }
 
 
+def _write_assessment(repo_dir: Path, payload: bytes, name: str) -> Path:
+    """Write serialized assessment JSON to repo_dir/.agentready/<name>."""
+    agentready_dir = repo_dir / ".agentready"
+    agentready_dir.mkdir(parents=True, exist_ok=True)
+
+    assessment_file = agentready_dir / name
+    assessment_file.write_bytes(payload)
+    return assessment_file
+
+
+# Minimal assessment; write_assessment fills in the repository path per test
+_BASE_ASSESSMENT = {
+    "schema_version": "1.0.0",
+    "timestamp": "2025-11-22T06:00:00",
+    "repository": {
+        "name": "test",
+        "languages": {"Python": 100},
+        "total_files": 1,
+        "total_lines": 10,
+    },
+    "overall_score": 75.0,
+    "certification_level": "Gold",
+    "attributes_assessed": 1,
+    "attributes_total": 1,
+    "findings": [create_dummy_finding()],  # Need 1 finding to match attributes_total
+    "duration_seconds": 1.0,
+}
+
+
+@pytest.fixture(scope="session")
+def discovered_skill():
+    """Default skill shared by tests that only read it."""
+    return _make_skill()
+
+
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path, git_template):
     """Create a temporary directory initialized as a git repository."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        # Initialize as git repo to satisfy Repository model validation
-        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
-        yield tmp_path
+    # Hard-link the read-only template files; tests only add files alongside them
+    shutil.copytree(git_template, tmp_path, copy_function=os.link, dirs_exist_ok=True)
+    return tmp_path
 
 
 @pytest.fixture
-def sample_assessment_file(temp_dir):
+def sample_assessment_file(temp_dir, assessment_bytes):
     """Create a sample assessment file."""
-    assessment_data = {
-        "schema_version": "1.0.0",
-        "timestamp": "2025-11-22T06:00:00",
-        "repository": {
-            "name": "test-repo",
-            "path": str(temp_dir),
-            "url": None,
-            "branch": "main",
-            "commit_hash": "abc123",
-            "languages": {"Python": 100},
-            "total_files": 5,
-            "total_lines": 100,
-        },
-        "overall_score": 85.0,
-        "certification_level": "Gold",
-        "attributes_assessed": 2,
-        "attributes_not_assessed": 0,
-        "attributes_total": 2,
-        "findings": [
-            {
-                "attribute": {
-                    "id": "claude_md_file",
-                    "name": "CLAUDE.md File",
-                    "category": "Documentation",
-                    "tier": 1,
-                    "description": "Test attribute",
-                    "criteria": "Must exist",
-                    "default_weight": 1.0,
-                },
-                "status": "pass",
-                "score": 100.0,
-                "measured_value": "present",
-                "threshold": "present",
-                "evidence": ["CLAUDE.md exists at root"],
-                "error_message": None,
-            },
-            {
-                "attribute": {
-                    "id": "type_annotations",
-                    "name": "Type Annotations",
-                    "category": "Code Quality",
-                    "tier": 2,
-                    "description": "Type hints in Python code",
-                    "criteria": ">=80% coverage",
-                    "default_weight": 1.0,
-                },
-                "status": "pass",
-                "score": 90.0,
-                "measured_value": "90%",
-                "threshold": "80%",
-                "evidence": ["90% of functions have type hints"],
-                "error_message": None,
-            },
-        ],
-        "duration_seconds": 1.5,
-    }
+    return _write_assessment(temp_dir, assessment_bytes, "assessment-latest.json")
 
-    # Create .agentready directory
-    agentready_dir = temp_dir / ".agentready"
-    agentready_dir.mkdir()
 
-    assessment_file = agentready_dir / "assessment-latest.json"
-    with open(assessment_file, "w") as f:
-        json.dump(assessment_data, f)
+@pytest.fixture
+def write_assessment(temp_dir):
+    """Factory writing _BASE_ASSESSMENT plus overrides under temp_dir/.agentready."""
+
+    def _write(overrides: dict, filename: str) -> Path:
+        data = {
+            **_BASE_ASSESSMENT,
+            "repository": {**_BASE_ASSESSMENT["repository"], "path": str(temp_dir)},
+            **overrides,
+        }
+        return _write_assessment(temp_dir, json.dumps(data).encode(), filename)
+
+    return _write
+
+
+@pytest.fixture
+def mock_extractor(monkeypatch):
+    """Replace the PatternExtractor class used by the learning service."""
+    m = MagicMock()
+    monkeypatch.setattr("agentready.services.learning_service.PatternExtractor", m)
+    return m
 
-    return assessment_file
+
+@pytest.fixture
+def mock_enricher(monkeypatch):
+    """Replace the LLMEnricher class imported lazily by the learning service."""
+    m = MagicMock()
+    monkeypatch.setattr("agentready.learners.llm_enricher.LLMEnricher", m)
+    return m
 
 
 class TestLearningService:
@@ -124,14 +151,14 @@ class TestLearningService:
         assert service.min_confidence == 70.0
         assert service.output_dir == Path(".skills-proposals")
 
-    def test_init_custom_params(self, temp_dir):
+    def test_init_custom_params(self):
         """Test initialization with custom parameters."""
-        service = LearningService(
-            min_confidence=80.0, output_dir=temp_dir / "custom-skills"
-        )
+        # Never created or read; only attribute storage is checked
+        output_dir = Path("/nonexistent/custom-skills")
+        service = LearningService(min_confidence=80.0, output_dir=output_dir)
 
         assert service.min_confidence == 80.0
-        assert service.output_dir == temp_dir / "custom-skills"
+        assert service.output_dir == output_dir
 
     def test_load_assessment_valid_file(self, sample_assessment_file):
         """Test loading a valid assessment file."""
@@ -142,51 +169,40 @@ class TestLearningService:
         assert assessment["overall_score"] == 85.0
         assert len(assessment["findings"]) == 2
 
-    def test_load_assessment_nonexistent_file(self, temp_dir):
+    def test_load_assessment_nonexistent_file(self, tmp_path):
         """Test loading a non-existent assessment file."""
         service = LearningService()
-        nonexistent = temp_dir / "nonexistent.json"
+        nonexistent = tmp_path / "nonexistent.json"
 
         with pytest.raises(FileNotFoundError):
             service.load_assessment(nonexistent)
 
-    def test_load_assessment_invalid_json(self, temp_dir):
+    def test_load_assessment_invalid_json(self, tmp_path):
         """Test loading an invalid JSON file."""
         service = LearningService()
-        invalid_file = temp_dir / "invalid.json"
+        invalid_file = tmp_path / "invalid.json"
         invalid_file.write_text("{invalid json")
 
         with pytest.raises(ValueError, match="Invalid JSON"):
             service.load_assessment(invalid_file)
 
-    def test_load_assessment_empty_file(self, temp_dir):
+    def test_load_assessment_empty_file(self, tmp_path):
         """Test loading an empty JSON file."""
         service = LearningService()
-        empty_file = temp_dir / "empty.json"
+        empty_file = tmp_path / "empty.json"
         empty_file.write_text("")
 
         with pytest.raises(ValueError):
             service.load_assessment(empty_file)
 
-    @patch("agentready.services.learning_service.PatternExtractor")
     def test_extract_patterns_from_file_basic(
-        self, mock_extractor, sample_assessment_file, temp_dir
+        self, mock_extractor, sample_assessment_file, temp_dir, discovered_skill
     ):
         """Test basic pattern extraction from file."""
         # Mock pattern extractor
-        mock_skill = DiscoveredSkill(
-            skill_id="test-skill",
-            name="Test Skill",
-            description="Test description",
-            confidence=95.0,
-            source_attribute_id="claude_md_file",
-            reusability_score=100.0,
-            impact_score=50.0,
-            pattern_summary="Test pattern",
-            code_examples=["example"],
-            citations=[],
-        )
-        mock_extractor.return_value.extract_all_patterns.return_value = [mock_skill]
+        mock_extractor.return_value.extract_all_patterns.return_value = [
+            discovered_skill
+        ]
 
         service = LearningService(output_dir=temp_dir)
         skills = service.extract_patterns_from_file(sample_assessment_file)
@@ -195,25 +211,12 @@ class TestLearningService:
         assert len(skills) == 1
         assert skills[0].skill_id == "test-skill"
 
-    @patch("agentready.services.learning_service.PatternExtractor")
     def test_extract_patterns_with_attribute_filter(
-        self, mock_extractor, sample_assessment_file, temp_dir
+        self, mock_extractor, sample_assessment_file, temp_dir, discovered_skill
     ):
         """Test pattern extraction with attribute filter."""
-        mock_skill = DiscoveredSkill(
-            skill_id="test-skill",
-            name="Test Skill",
-            description="Test description",
-            confidence=95.0,
-            source_attribute_id="claude_md_file",
-            reusability_score=100.0,
-            impact_score=50.0,
-            pattern_summary="Test pattern",
-            code_examples=["example"],
-            citations=[],
-        )
         mock_extractor.return_value.extract_specific_patterns.return_value = [
-            mock_skill
+            discovered_skill
         ]
 
         service = LearningService(output_dir=temp_dir)
@@ -224,35 +227,23 @@ class TestLearningService:
         # Should filter by attribute
         assert len(skills) >= 0  # Depends on implementation
 
-    @patch("agentready.services.learning_service.PatternExtractor")
     def test_extract_patterns_filters_by_confidence(
         self, mock_extractor, sample_assessment_file, temp_dir
     ):
         """Test pattern extraction filters by confidence threshold."""
         # Create skills with different confidence levels
-        high_confidence = DiscoveredSkill(
+        high_confidence = _make_skill(
             skill_id="high",
             name="High Confidence",
             description="High",
-            confidence=95.0,
-            source_attribute_id="claude_md_file",
-            reusability_score=100.0,
-            impact_score=50.0,
             pattern_summary="High pattern",
-            code_examples=["example"],
-            citations=[],
         )
-        low_confidence = DiscoveredSkill(
+        low_confidence = _make_skill(
             skill_id="low",
             name="Low Confidence",
             description="Low",
             confidence=50.0,
-            source_attribute_id="claude_md_file",
-            reusability_score=100.0,
-            impact_score=50.0,
             pattern_summary="Low pattern",
-            code_examples=["example"],
-            citations=[],
         )
         mock_extractor.return_value.extract_all_patterns.return_value = [
             high_confidence,
@@ -267,39 +258,17 @@ class TestLearningService:
         high_conf_skills = [s for s in skills if s.confidence >= 70.0]
         assert len(high_conf_skills) >= 1
 
-    @patch("agentready.services.learning_service.PatternExtractor")
-    @patch("agentready.learners.llm_enricher.LLMEnricher")
     def test_extract_patterns_with_llm_enrichment(
-        self, mock_enricher, mock_extractor, sample_assessment_file, temp_dir
+        self, mock_extractor, mock_enricher, sample_assessment_file, temp_dir
     ):
         """Test pattern extraction with LLM enrichment."""
         # Mock basic skill
-        basic_skill = DiscoveredSkill(
-            skill_id="test",
-            name="Test",
-            description="Basic",
-            confidence=95.0,
-            source_attribute_id="claude_md_file",
-            reusability_score=100.0,
-            impact_score=50.0,
-            pattern_summary="Pattern",
-            code_examples=["example"],
-            citations=[],
-        )
+        basic_skill = _make_skill(description="Basic")
         mock_extractor.return_value.extract_all_patterns.return_value = [basic_skill]
 
         # Mock enriched skill
-        enriched_skill = DiscoveredSkill(
-            skill_id="test",
-            name="Test",
-            description="Enhanced by LLM",
-            confidence=95.0,
-            source_attribute_id="claude_md_file",
-            reusability_score=100.0,
-            impact_score=50.0,
-            pattern_summary="Pattern",
-            code_examples=["enhanced example"],
-            citations=[],
+        enriched_skill = _make_skill(
+            description="Enhanced by LLM", code_examples=["enhanced example"]
         )
         mock_enricher.return_value.enrich_skill.return_value = enriched_skill
 
@@ -311,84 +280,38 @@ class TestLearningService:
         # Should have enriched skills
         assert len(skills) >= 1
 
-    def test_extract_patterns_missing_assessment_keys(self, temp_dir):
-        """Test extract_patterns handles assessment with missing keys."""
-        # Create assessment with missing optional keys
-        minimal_assessment = {
-            "schema_version": "1.0.0",
-            "timestamp": "2025-11-22T06:00:00",
-            "repository": {
-                "name": "test",
-                "path": str(temp_dir),
-                "languages": {"Python": 100},
-                "total_files": 1,
-                "total_lines": 10,
-            },
-            "overall_score": 75.0,
-            "certification_level": "Gold",
-            "attributes_assessed": 1,
-            "attributes_total": 1,
-            "findings": [
-                create_dummy_finding()
-            ],  # Need 1 finding to match attributes_total
-            "duration_seconds": 1.0,
-        }
-
-        # Create .agentready directory
-        agentready_dir = temp_dir / ".agentready"
-        agentready_dir.mkdir()
-
-        assessment_file = agentready_dir / "minimal.json"
-        with open(assessment_file, "w") as f:
-            json.dump(minimal_assessment, f)
-
-        service = LearningService(output_dir=temp_dir)
-
-        # Should handle gracefully (may return empty list)
-        with patch("agentready.services.learning_service.PatternExtractor") as mock:
-            mock.return_value.extract_all_patterns.return_value = []
-            skills = service.extract_patterns_from_file(assessment_file)
-            assert isinstance(skills, list)
-
-    def test_extract_patterns_with_old_schema_key(self, temp_dir):
-        """Test extract_patterns handles old schema key names."""
-        # Old schema used "attributes_skipped" instead of "attributes_not_assessed"
-        old_schema_assessment = {
-            "schema_version": "1.0.0",
-            "timestamp": "2025-11-22T06:00:00",
-            "repository": {
-                "name": "test",
-                "path": str(temp_dir),
-                "languages": {"Python": 100},
-                "total_files": 1,
-                "total_lines": 10,
-            },
-            "overall_score": 75.0,
-            "certification_level": "Gold",
-            "attributes_assessed": 1,
-            "attributes_skipped": 0,  # Old key
-            "attributes_total": 1,
-            "findings": [
-                create_dummy_finding()
-            ],  # Need 1 finding to match attributes_total
-            "duration_seconds": 1.0,
-        }
-
-        # Create .agentready directory
-        agentready_dir = temp_dir / ".agentready"
-        agentready_dir.mkdir()
-
-        assessment_file = agentready_dir / "old.json"
-        with open(assessment_file, "w") as f:
-            json.dump(old_schema_assessment, f)
+    @pytest.mark.parametrize(
+        ("overrides", "filename"),
+        [
+            # Missing optional keys (no attributes_not_assessed, url, branch...)
+            pytest.param({}, "minimal.json", id="missing_assessment_keys"),
+            # Old schema used "attributes_skipped" instead of "attributes_not_assessed"
+            pytest.param({"attributes_skipped": 0}, "old.json", id="old_schema_key"),
+            # Only not_applicable findings
+            pytest.param(
+                {
+                    "overall_score": 0.0,
+                    "certification_level": "Needs Improvement",
+                    "attributes_assessed": 0,
+                    "attributes_not_assessed": 1,
+                },
+                "empty.json",
+                id="empty_findings",
+            ),
+        ],
+    )
+    def test_extract_patterns_assessment_variants(
+        self, mock_extractor, write_assessment, temp_dir, overrides, filename
+    ):
+        """Test extract_patterns handles minimal, old-schema and empty assessments."""
+        assessment_file = write_assessment(overrides, filename)
+        mock_extractor.return_value.extract_all_patterns.return_value = []
 
         service = LearningService(output_dir=temp_dir)
+        skills = service.extract_patterns_from_file(assessment_file)
 
-        # Should handle gracefully
-        with patch("agentready.services.learning_service.PatternExtractor") as mock:
-            mock.return_value.extract_all_patterns.return_value = []
-            skills = service.extract_patterns_from_file(assessment_file)
-            assert isinstance(skills, list)
+        # Should handle gracefully and return an empty list
+        assert skills == []
 
 
 class TestLearningServiceEdgeCases:
@@ -411,48 +334,6 @@ class TestLearningServiceEdgeCases:
         service2 = LearningService(min_confidence=100.0)
         assert service2.min_confidence == 100.0
 
-    @patch("agentready.services.learning_service.PatternExtractor")
-    def test_extract_patterns_empty_findings(self, mock_extractor, temp_dir):
-        """Test extract_patterns with empty findings list."""
-        # Create assessment with minimal findings (not_applicable)
-        assessment_data = {
-            "schema_version": "1.0.0",
-            "timestamp": "2025-11-22T06:00:00",
-            "repository": {
-                "name": "test",
-                "path": str(temp_dir),
-                "languages": {"Python": 100},
-                "total_files": 1,
-                "total_lines": 10,
-            },
-            "overall_score": 0.0,
-            "certification_level": "Needs Improvement",
-            "attributes_assessed": 0,
-            "attributes_not_assessed": 1,
-            "attributes_total": 1,
-            "findings": [
-                create_dummy_finding()
-            ],  # Need 1 finding to match attributes_total
-            "duration_seconds": 1.0,
-        }
-
-        # Create .agentready directory
-        agentready_dir = temp_dir / ".agentready"
-        agentready_dir.mkdir()
-
-        assessment_file = agentready_dir / "empty.json"
-        with open(assessment_file, "w") as f:
-            json.dump(assessment_data, f)
-
-        mock_extractor.return_value.extract_all_patterns.return_value = []
-
-        service = LearningService(output_dir=temp_dir)
-        skills = service.extract_patterns_from_file(assessment_file)
-
-        # Should return empty list
-        assert skills == []
-
-    @patch("agentready.services.learning_service.PatternExtractor")
     def test_extract_patterns_multiple_attribute_ids(
         self, mock_extractor, sample_assessment_file, temp_dir
     ):
@@ -468,24 +349,13 @@ class TestLearningServiceEdgeCases:
         # Should handle multiple attributes
         assert isinstance(skills, list)
 
-    @patch("agentready.services.learning_service.PatternExtractor")
     def test_extract_patterns_llm_budget_zero(
-        self, mock_extractor, sample_assessment_file, temp_dir
+        self, mock_extractor, sample_assessment_file, temp_dir, discovered_skill
     ):
         """Test extract_patterns with zero LLM budget."""
-        mock_skill = DiscoveredSkill(
-            skill_id="test",
-            name="Test",
-            description="Test",
-            confidence=95.0,
-            source_attribute_id="claude_md_file",
-            reusability_score=100.0,
-            impact_score=50.0,
-            pattern_summary="Pattern",
-            code_examples=["example"],
-            citations=[],
-        )
-        mock_extractor.return_value.extract_all_patterns.return_value = [mock_skill]
+        mock_extractor.return_value.extract_all_patterns.return_value = [
+            discovered_skill
+        ]
 
         service = LearningService(output_dir=temp_dir)
         skills = service.extract_patterns_from_file(
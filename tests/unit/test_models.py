@@ -2,6 +2,8 @@
 
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
 
@@ -20,18 +22,153 @@ from agentready.models.fix import (
 from agentready.models.metadata import AssessmentMetadata
 from agentready.models.repository import Repository
 
+# In-memory (pyfakefs) repository root for Repository, Assessment and Fix tests
+REPO_PATH = Path("/repo")
+
+# Valid DiscoveredSkill fields (read-only); validation tests override one field
+# at a time
+_BASE_SKILL = MappingProxyType(
+    {
+        "skill_id": "test-skill",
+        "name": "Test Skill",
+        "description": "Test description",
+        "confidence": 85.0,
+        "source_attribute_id": "test_attr",
+        "reusability_score": 90.0,
+        "impact_score": 50.0,
+        "pattern_summary": "Test pattern",
+    }
+)
+
+# Valid Attribute, Finding (minus attribute) and Remediation fields; tests
+# override only the fields under test. List-valued fields are left out of the
+# read-only mappings and built per call, so no two instances share a list.
+_BASE_ATTR = MappingProxyType(
+    {
+        "id": "test",
+        "name": "Test",
+        "category": "Test",
+        "tier": 1,
+        "description": "Test",
+        "criteria": "Test",
+        "default_weight": 0.10,
+    }
+)
+
+_BASE_FINDING = MappingProxyType(
+    {
+        "status": "pass",
+        "score": 100.0,
+        "measured_value": "test",
+        "threshold": "test",
+        "remediation": None,
+        "error_message": None,
+    }
+)
+
+
+def _remediation_kwargs(**overrides) -> dict:
+    """Valid Remediation fields with fresh lists, updated with overrides."""
+    return {
+        "summary": "Fix it",
+        "steps": ["Step 1"],
+        "tools": [],
+        "commands": [],
+        "examples": [],
+        "citations": [],
+        **overrides,
+    }
+
+
+# One character over DiscoveredSkill's 1024-character description limit
+_LONG_DESC = "x" * 1025
+
+# (field, invalid value, expected error) for DiscoveredSkill validation
+_SKILL_VALIDATION_CASES = (
+    ("skill_id", "", "must be non-empty"),
+    ("skill_id", "Invalid ID!", "must be lowercase"),
+    ("skill_id", "Test Skill", "must be lowercase"),
+    ("skill_id", "test skill", "must be lowercase"),
+    ("name", "", "must be non-empty"),
+    ("description", "", "must be non-empty"),
+    ("confidence", -1.0, "must be in range"),
+    ("confidence", 101.0, "must be in range"),
+    ("reusability_score", -1.0, "must be in range"),
+    ("reusability_score", 150.0, "must be in range"),
+    ("impact_score", -1.0, "must be in range"),
+    ("impact_score", 150.0, "must be in range"),
+    ("source_attribute_id", "", "must be non-empty"),
+    ("pattern_summary", "", "must be non-empty"),
+)
+
+
+@pytest.fixture(scope="session")
+def frozen_now():
+    """Fixed assessment timestamp; avoids clock reads in every test."""
+    return datetime(2025, 11, 21, 2, 11, 5)
+
+
+@pytest.fixture(scope="session")
+def sample_metadata(frozen_now):
+    """Metadata built once; create() resolves user, host and cwd."""
+    return AssessmentMetadata.create(
+        version="1.0.0",
+        research_version="1.2.0",
+        timestamp=frozen_now,
+        command="agentready assess .",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_repo():
+    """Repository built once, skipping path/.git validation (no disk access)."""
+    with patch.object(Repository, "__post_init__"):
+        return Repository(
+            path=REPO_PATH,
+            name="test",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 5},
+            total_files=10,
+            total_lines=200,
+        )
+
+
+@pytest.fixture(scope="module")
+def sample_attr():
+    """Canonical attribute shared by Finding and Assessment tests."""
+    return Attribute(**_BASE_ATTR)
+
+
+@pytest.fixture
+def make_finding(sample_attr):
+    """Factory for Findings on sample_attr; defaults to a passing finding."""
+
+    def _make_finding(**overrides):
+        return Finding(
+            attribute=sample_attr, **{**_BASE_FINDING, "evidence": [], **overrides}
+        )
+
+    return _make_finding
+
+
+@pytest.fixture
+def passing_findings(make_finding):
+    """25 passing findings, matching attributes_total in Assessment tests."""
+    return [make_finding() for _ in range(25)]
+
 
 class TestRepository:
     """Test Repository model."""
 
-    def test_repository_creation(self, tmp_path):
+    @pytest.mark.fs
+    def test_repository_creation(self, fs):
         """Test creating a valid repository."""
-        # Create a fake git repo
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
+        fs.create_dir(REPO_PATH / ".git")
 
         repo = Repository(
-            path=tmp_path,
+            path=REPO_PATH,
             name="test-repo",
             url="https://github.com/test/repo",
             branch="main",
@@ -59,23 +196,9 @@ class TestRepository:
                 total_lines=0,
             )
 
-    def test_repository_to_dict(self, tmp_path):
+    def test_repository_to_dict(self, sample_repo):
         """Test repository serialization."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-
-        repo = Repository(
-            path=tmp_path,
-            name="test",
-            url=None,
-            branch="main",
-            commit_hash="abc123",
-            languages={"Python": 5},
-            total_files=10,
-            total_lines=200,
-        )
-
-        data = repo.to_dict()
+        data = sample_repo.to_dict()
         assert data["name"] == "test"
         assert data["languages"] == {"Python": 5}
 
@@ -99,74 +222,33 @@ class TestAttribute:
         assert attr.tier == 1
         assert attr.default_weight == 0.10
 
-    def test_attribute_invalid_tier(self):
-        """Test attribute with invalid tier."""
-        with pytest.raises(ValueError, match="Tier must be"):
-            Attribute(
-                id="test",
-                name="Test",
-                category="Test",
-                tier=5,  # Invalid
-                description="Test",
-                criteria="Test",
-                default_weight=0.10,
-            )
-
-    def test_attribute_invalid_weight(self):
-        """Test attribute with invalid weight."""
-        with pytest.raises(ValueError, match="weight must be"):
-            Attribute(
-                id="test",
-                name="Test",
-                category="Test",
-                tier=1,
-                description="Test",
-                criteria="Test",
-                default_weight=1.5,  # Invalid
-            )
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            pytest.param({"tier": 5}, "Tier must be", id="invalid_tier"),
+            pytest.param(
+                {"default_weight": 1.5}, "weight must be", id="invalid_weight"
+            ),
+        ],
+    )
+    def test_attribute_invalid(self, overrides, match):
+        """Test attribute validation errors."""
+        with pytest.raises(ValueError, match=match):
+            Attribute(**{**_BASE_ATTR, **overrides})
 
 
 class TestFinding:
     """Test Finding model."""
 
-    def test_finding_pass(self):
+    def test_finding_pass(self, make_finding):
         """Test creating a passing finding."""
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.10,
-        )
-
-        finding = Finding(
-            attribute=attr,
-            status="pass",
-            score=100.0,
-            measured_value="present",
-            threshold="present",
-            evidence=["File found"],
-            remediation=None,
-            error_message=None,
-        )
+        finding = make_finding(evidence=["File found"])
 
         assert finding.status == "pass"
         assert finding.score == 100.0
 
-    def test_finding_fail_with_remediation(self):
+    def test_finding_fail_with_remediation(self, make_finding):
         """Test creating a failing finding with remediation."""
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.10,
-        )
-
         remediation = Remediation(
             summary="Fix the issue",
             steps=["Step 1", "Step 2"],
@@ -176,45 +258,18 @@ class TestFinding:
             citations=[],
         )
 
-        finding = Finding(
-            attribute=attr,
+        finding = make_finding(
             status="fail",
             score=0.0,
             measured_value="missing",
-            threshold="present",
             evidence=["File not found"],
             remediation=remediation,
-            error_message=None,
         )
 
         assert finding.status == "fail"
         assert finding.remediation is not None
         assert len(finding.remediation.steps) == 2
 
-    def test_finding_invalid_status(self):
-        """Test finding with invalid status."""
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.10,
-        )
-
-        with pytest.raises(ValueError, match="Status must be"):
-            Finding(
-                attribute=attr,
-                status="invalid",  # Invalid status
-                score=50.0,
-                measured_value="test",
-                threshold="test",
-                evidence=[],
-                remediation=None,
-                error_message=None,
-            )
-
 
 class TestConfig:
     """Test Config model."""
@@ -257,55 +312,17 @@ class TestConfig:
 class TestAssessment:
     """Test Assessment model."""
 
-    def test_assessment_creation(self, tmp_path):
+    def test_assessment_creation(self, sample_repo, passing_findings, frozen_now):
         """Test creating a valid assessment."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-
-        repo = Repository(
-            path=tmp_path,
-            name="test",
-            url=None,
-            branch="main",
-            commit_hash="abc",
-            languages={},
-            total_files=10,
-            total_lines=100,
-        )
-
-        # Create dummy findings to match total
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-        findings = [
-            Finding(
-                attribute=attr,
-                status="pass",
-                score=100.0,
-                measured_value="test",
-                threshold="test",
-                evidence=[],
-                remediation=None,
-                error_message=None,
-            )
-            for _ in range(25)
-        ]
-
         assessment = Assessment(
-            repository=repo,
-            timestamp=datetime.now(),
+            repository=sample_repo,
+            timestamp=frozen_now,
             overall_score=75.0,
             certification_level="Gold",
             attributes_assessed=20,
             attributes_not_assessed=5,
             attributes_total=25,
-            findings=findings,
+            findings=passing_findings,
             config=None,
             duration_seconds=1.5,
         )
@@ -313,25 +330,37 @@ class TestAssessment:
         assert assessment.overall_score == 75.0
         assert assessment.certification_level == "Gold"
 
-    def test_assessment_determine_certification(self):
+    @pytest.mark.parametrize(
+        ("score", "level"),
+        [
+            (95.0, "Platinum"),
+            (80.0, "Gold"),
+            (65.0, "Silver"),
+            (45.0, "Bronze"),
+            (20.0, "Needs Improvement"),
+        ],
+    )
+    def test_assessment_determine_certification(self, score, level):
         """Test certification level determination."""
-        assert Assessment.determine_certification_level(95.0) == "Platinum"
-        assert Assessment.determine_certification_level(80.0) == "Gold"
-        assert Assessment.determine_certification_level(65.0) == "Silver"
-        assert Assessment.determine_certification_level(45.0) == "Bronze"
-        assert Assessment.determine_certification_level(20.0) == "Needs Improvement"
+        assert Assessment.determine_certification_level(score) == level
 
 
 class TestAssessmentMetadata:
     """Test AssessmentMetadata model."""
 
-    def test_metadata_create(self):
+    def test_metadata_create(self, monkeypatch, frozen_now):
         """Test creating metadata from execution context."""
-        timestamp = datetime(2025, 11, 21, 2, 11, 5)
+        # Constant user/host so no passwd or hostname lookups happen
+        monkeypatch.setattr(
+            "agentready.models.metadata.getpass.getuser", lambda: "testuser"
+        )
+        monkeypatch.setattr(
+            "agentready.models.metadata.socket.gethostname", lambda: "testhost"
+        )
         metadata = AssessmentMetadata.create(
             version="1.0.0",
             research_version="1.2.0",
-            timestamp=timestamp,
+            timestamp=frozen_now,
             command="agentready assess . --verbose",
         )
 
@@ -339,20 +368,12 @@ class TestAssessmentMetadata:
         assert metadata.command == "agentready assess . --verbose"
         assert "2025" in metadata.assessment_timestamp  # ISO format
         assert "November 21, 2025" in metadata.assessment_timestamp_human
-        assert "@" in metadata.executed_by  # Should have user@host format
+        assert metadata.executed_by == "testuser@testhost"
         assert len(metadata.working_directory) > 0
 
-    def test_metadata_to_dict(self):
+    def test_metadata_to_dict(self, sample_metadata):
         """Test metadata serialization."""
-        timestamp = datetime(2025, 11, 21, 2, 11, 5)
-        metadata = AssessmentMetadata.create(
-            version="1.0.0",
-            research_version="1.2.0",
-            timestamp=timestamp,
-            command="agentready assess .",
-        )
-
-        data = metadata.to_dict()
+        data = sample_metadata.to_dict()
         assert data["agentready_version"] == "1.0.0"
         assert data["command"] == "agentready assess ."
         assert "assessment_timestamp" in data
@@ -376,65 +397,22 @@ class TestAssessmentMetadata:
         assert metadata.executed_by == "testuser@testhost"
         assert metadata.working_directory == "/home/user"
 
-    def test_assessment_with_metadata(self, tmp_path):
+    def test_assessment_with_metadata(
+        self, sample_repo, passing_findings, frozen_now, sample_metadata
+    ):
         """Test that Assessment can include metadata."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-
-        repo = Repository(
-            path=tmp_path,
-            name="test",
-            url=None,
-            branch="main",
-            commit_hash="abc",
-            languages={},
-            total_files=10,
-            total_lines=100,
-        )
-
-        timestamp = datetime.now()
-        metadata = AssessmentMetadata.create(
-            version="1.0.0",
-            research_version="1.2.0",
-            timestamp=timestamp,
-            command="agentready assess .",
-        )
-
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-        findings = [
-            Finding(
-                attribute=attr,
-                status="pass",
-                score=100.0,
-                measured_value="test",
-                threshold="test",
-                evidence=[],
-                remediation=None,
-                error_message=None,
-            )
-            for _ in range(25)
-        ]
-
         assessment = Assessment(
-            repository=repo,
-            timestamp=timestamp,
+            repository=sample_repo,
+            timestamp=frozen_now,
             overall_score=75.0,
             certification_level="Gold",
             attributes_assessed=25,
             attributes_not_assessed=0,
             attributes_total=25,
-            findings=findings,
+            findings=passing_findings,
             config=None,
             duration_seconds=1.5,
-            metadata=metadata,
+            metadata=sample_metadata,
         )
 
         assert assessment.metadata is not None
@@ -495,55 +473,17 @@ class TestDiscoveredSkill:
         assert len(skill.code_examples) == 2
         assert len(skill.citations) == 1
 
-    @pytest.mark.parametrize(
-        "field,value,error_match",
-        [
-            ("skill_id", "", "must be non-empty"),
-            ("skill_id", "Invalid ID!", "must be lowercase"),
-            ("skill_id", "Test Skill", "must be lowercase"),
-            ("skill_id", "test skill", "must be lowercase"),
-            ("name", "", "must be non-empty"),
-            ("description", "", "must be non-empty"),
-            ("confidence", -1.0, "must be in range"),
-            ("confidence", 101.0, "must be in range"),
-            ("reusability_score", -1.0, "must be in range"),
-            ("reusability_score", 150.0, "must be in range"),
-            ("impact_score", -1.0, "must be in range"),
-            ("impact_score", 150.0, "must be in range"),
-            ("source_attribute_id", "", "must be non-empty"),
-            ("pattern_summary", "", "must be non-empty"),
-        ],
-    )
-    def test_validation_errors(self, field, value, error_match):
+    def test_validation_errors(self):
         """Test DiscoveredSkill validation catches invalid values."""
-        base_data = {
-            "skill_id": "test-skill",
-            "name": "Test Skill",
-            "description": "Test description",
-            "confidence": 85.0,
-            "source_attribute_id": "test_attr",
-            "reusability_score": 90.0,
-            "impact_score": 50.0,
-            "pattern_summary": "Test pattern",
-        }
-        base_data[field] = value
-
-        with pytest.raises(ValueError, match=error_match):
-            DiscoveredSkill(**base_data)
+        # One test item for all cases; each case overrides a single valid field
+        for field, value, error_match in _SKILL_VALIDATION_CASES:
+            with pytest.raises(ValueError, match=error_match):
+                DiscoveredSkill(**{**_BASE_SKILL, field: value})
 
     def test_description_too_long(self):
         """Test DiscoveredSkill validation for description length."""
         with pytest.raises(ValueError, match="too long"):
-            DiscoveredSkill(
-                skill_id="test-skill",
-                name="Test Skill",
-                description="x" * 1025,  # Over 1024 chars
-                confidence=85.0,
-                source_attribute_id="test_attr",
-                reusability_score=90.0,
-                impact_score=50.0,
-                pattern_summary="Test pattern",
-            )
+            DiscoveredSkill(**{**_BASE_SKILL, "description": _LONG_DESC})
 
     def test_to_dict(self):
         """Test DiscoveredSkill serialization."""
@@ -611,7 +551,7 @@ class TestDiscoveredSkill:
 class TestFixModels:
     """Test Fix models."""
 
-    def test_file_creation_fix_construction(self, tmp_path):
+    def test_file_creation_fix_construction(self):
         """Test creating a FileCreationFix."""
         fix = FileCreationFix(
             attribute_id="test_attr",
@@ -619,7 +559,7 @@ class TestFixModels:
             points_gained=10.0,
             file_path=Path("test.txt"),
             content="Test content",
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         assert fix.attribute_id == "test_attr"
@@ -628,44 +568,53 @@ class TestFixModels:
         assert fix.file_path == Path("test.txt")
         assert fix.content == "Test content"
 
-    def test_file_creation_fix_apply(self, tmp_path):
+    @pytest.mark.fs
+    def test_file_creation_fix_apply(self, fs):
         """Test FileCreationFix.apply() creates file."""
+        fs.create_dir(REPO_PATH)
+
         fix = FileCreationFix(
             attribute_id="test_attr",
             description="Create test file",
             points_gained=10.0,
             file_path=Path("test.txt"),
             content="Test content",
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         result = fix.apply(dry_run=False)
         assert result is True
 
-        target_file = tmp_path / "test.txt"
+        target_file = REPO_PATH / "test.txt"
         assert target_file.exists()
         assert target_file.read_text() == "Test content"
 
-    def test_file_creation_fix_dry_run(self, tmp_path):
+    @pytest.mark.fs
+    def test_file_creation_fix_dry_run(self, fs):
         """Test FileCreationFix.apply() with dry_run."""
+        fs.create_dir(REPO_PATH)
+
         fix = FileCreationFix(
             attribute_id="test_attr",
             description="Create test file",
             points_gained=10.0,
             file_path=Path("test.txt"),
             content="Test content",
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         result = fix.apply(dry_run=True)
         assert result is True
 
-        target_file = tmp_path / "test.txt"
+        target_file = REPO_PATH / "test.txt"
         assert not target_file.exists()
 
-    def test_file_creation_fix_existing_file(self, tmp_path):
+    @pytest.mark.fs
+    def test_file_creation_fix_existing_file(self, fs):
         """Test FileCreationFix fails if file exists."""
-        target_file = tmp_path / "test.txt"
+        fs.create_dir(REPO_PATH)
+
+        target_file = REPO_PATH / "test.txt"
         target_file.write_text("Existing content")
 
         fix = FileCreationFix(
@@ -674,13 +623,13 @@ class TestFixModels:
             points_gained=10.0,
             file_path=Path("test.txt"),
             content="Test content",
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         result = fix.apply(dry_run=False)
         assert result is False
 
-    def test_file_creation_fix_preview(self, tmp_path):
+    def test_file_creation_fix_preview(self):
         """Test FileCreationFix.preview()."""
         fix = FileCreationFix(
             attribute_id="test_attr",
@@ -688,14 +637,14 @@ class TestFixModels:
             points_gained=10.0,
             file_path=Path("test.txt"),
             content="Test content",
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         preview = fix.preview()
         assert "CREATE" in preview
         assert "test.txt" in preview
 
-    def test_file_modification_fix_construction(self, tmp_path):
+    def test_file_modification_fix_construction(self):
         """Test creating a FileModificationFix."""
         fix = FileModificationFix(
             attribute_id="test_attr",
@@ -703,7 +652,7 @@ class TestFixModels:
             points_gained=10.0,
             file_path=Path("test.txt"),
             additions=["line1", "line2"],
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
             append=True,
         )
 
@@ -711,9 +660,12 @@ class TestFixModels:
         assert len(fix.additions) == 2
         assert fix.append is True
 
-    def test_file_modification_fix_apply_append(self, tmp_path):
+    @pytest.mark.fs
+    def test_file_modification_fix_apply_append(self, fs):
         """Test FileModificationFix.apply() with append mode."""
-        target_file = tmp_path / "test.txt"
+        fs.create_dir(REPO_PATH)
+
+        target_file = REPO_PATH / "test.txt"
         target_file.write_text("Existing content\n")
 
         fix = FileModificationFix(
@@ -722,7 +674,7 @@ class TestFixModels:
             points_gained=10.0,
             file_path=Path("test.txt"),
             additions=["line1", "line2"],
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
             append=True,
         )
 
@@ -734,21 +686,24 @@ class TestFixModels:
         assert "line1" in content
         assert "line2" in content
 
-    def test_file_modification_fix_missing_file(self, tmp_path):
+    @pytest.mark.fs
+    def test_file_modification_fix_missing_file(self, fs):
         """Test FileModificationFix fails if file doesn't exist."""
+        fs.create_dir(REPO_PATH)
+
         fix = FileModificationFix(
             attribute_id="test_attr",
             description="Modify test file",
             points_gained=10.0,
             file_path=Path("nonexistent.txt"),
             additions=["line1"],
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         result = fix.apply(dry_run=False)
         assert result is False
 
-    def test_file_modification_fix_preview(self, tmp_path):
+    def test_file_modification_fix_preview(self):
         """Test FileModificationFix.preview()."""
         fix = FileModificationFix(
             attribute_id="test_attr",
@@ -756,7 +711,7 @@ class TestFixModels:
             points_gained=10.0,
             file_path=Path("test.txt"),
             additions=["line1", "line2"],
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         preview = fix.preview()
@@ -764,7 +719,7 @@ class TestFixModels:
         assert "test.txt" in preview
         assert "+2" in preview
 
-    def test_command_fix_construction(self, tmp_path):
+    def test_command_fix_construction(self):
         """Test creating a CommandFix."""
         fix = CommandFix(
             attribute_id="test_attr",
@@ -772,14 +727,14 @@ class TestFixModels:
             points_gained=10.0,
             command="echo test",
             working_dir=None,
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         assert fix.attribute_id == "test_attr"
         assert fix.command == "echo test"
         assert fix.working_dir is None
 
-    def test_command_fix_preview(self, tmp_path):
+    def test_command_fix_preview(self):
         """Test CommandFix.preview()."""
         fix = CommandFix(
             attribute_id="test_attr",
@@ -787,14 +742,14 @@ class TestFixModels:
             points_gained=10.0,
             command="echo test",
             working_dir=None,
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         preview = fix.preview()
         assert "RUN" in preview
         assert "echo test" in preview
 
-    def test_multi_step_fix_construction(self, tmp_path):
+    def test_multi_step_fix_construction(self):
         """Test creating a MultiStepFix."""
         fix1 = FileCreationFix(
             attribute_id="test",
@@ -802,7 +757,7 @@ class TestFixModels:
             points_gained=5.0,
             file_path=Path("test.txt"),
             content="Test",
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         fix2 = CommandFix(
@@ -811,7 +766,7 @@ class TestFixModels:
             points_gained=5.0,
             command="echo test",
             working_dir=None,
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         multi_fix = MultiStepFix(
@@ -824,15 +779,18 @@ class TestFixModels:
         assert multi_fix.attribute_id == "test_attr"
         assert len(multi_fix.steps) == 2
 
-    def test_multi_step_fix_apply(self, tmp_path):
+    @pytest.mark.fs
+    def test_multi_step_fix_apply(self, fs):
         """Test MultiStepFix.apply() executes all steps."""
+        fs.create_dir(REPO_PATH)
+
         fix1 = FileCreationFix(
             attribute_id="test",
             description="Create file",
             points_gained=5.0,
             file_path=Path("test.txt"),
             content="Test",
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         fix2 = FileCreationFix(
@@ -841,7 +799,7 @@ class TestFixModels:
             points_gained=5.0,
             file_path=Path("test2.txt"),
             content="Test2",
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         multi_fix = MultiStepFix(
@@ -854,10 +812,10 @@ class TestFixModels:
         result = multi_fix.apply(dry_run=False)
         assert result is True
 
-        assert (tmp_path / "test.txt").exists()
-        assert (tmp_path / "test2.txt").exists()
+        assert (REPO_PATH / "test.txt").exists()
+        assert (REPO_PATH / "test2.txt").exists()
 
-    def test_multi_step_fix_preview(self, tmp_path):
+    def test_multi_step_fix_preview(self):
         """Test MultiStepFix.preview()."""
         fix1 = FileCreationFix(
             attribute_id="test",
@@ -865,7 +823,7 @@ class TestFixModels:
             points_gained=5.0,
             file_path=Path("test.txt"),
             content="Test",
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         fix2 = CommandFix(
@@ -874,7 +832,7 @@ class TestFixModels:
             points_gained=5.0,
             command="echo test",
             working_dir=None,
-            repository_path=tmp_path,
+            repository_path=REPO_PATH,
         )
 
         multi_fix = MultiStepFix(
@@ -894,19 +852,9 @@ class TestFixModels:
 class TestFindingFactories:
     """Test Finding factory methods."""
 
-    def test_finding_not_applicable_factory(self):
+    def test_finding_not_applicable_factory(self, sample_attr):
         """Test Finding.not_applicable() factory method."""
-        attr = Attribute(
-            id="test_attr",
-            name="Test",
-            category="Testing",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
-        finding = Finding.not_applicable(attr, reason="Not a Python project")
+        finding = Finding.not_applicable(sample_attr, reason="Not a Python project")
 
         assert finding.status == "not_applicable"
         assert finding.score is None
@@ -916,37 +864,17 @@ class TestFindingFactories:
         assert finding.remediation is None
         assert finding.error_message is None
 
-    def test_finding_not_applicable_no_reason(self):
+    def test_finding_not_applicable_no_reason(self, sample_attr):
         """Test Finding.not_applicable() without reason."""
-        attr = Attribute(
-            id="test_attr",
-            name="Test",
-            category="Testing",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
-        finding = Finding.not_applicable(attr)
+        finding = Finding.not_applicable(sample_attr)
 
         assert finding.status == "not_applicable"
         assert finding.evidence == []
 
-    def test_finding_skipped_factory_with_remediation(self):
+    def test_finding_skipped_factory_with_remediation(self, sample_attr):
         """Test Finding.skipped() factory method with remediation."""
-        attr = Attribute(
-            id="test_attr",
-            name="Test",
-            category="Testing",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
         finding = Finding.skipped(
-            attr, reason="Missing pytest", remediation="Install pytest with pip"
+            sample_attr, reason="Missing pytest", remediation="Install pytest with pip"
         )
 
         assert finding.status == "skipped"
@@ -956,36 +884,16 @@ class TestFindingFactories:
         assert finding.remediation.summary == "Install pytest with pip"
         assert finding.error_message is None
 
-    def test_finding_skipped_factory_without_remediation(self):
+    def test_finding_skipped_factory_without_remediation(self, sample_attr):
         """Test Finding.skipped() factory method without remediation."""
-        attr = Attribute(
-            id="test_attr",
-            name="Test",
-            category="Testing",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
-        finding = Finding.skipped(attr, reason="Missing tool")
+        finding = Finding.skipped(sample_attr, reason="Missing tool")
 
         assert finding.status == "skipped"
         assert finding.remediation is None
 
-    def test_finding_error_factory(self):
+    def test_finding_error_factory(self, sample_attr):
         """Test Finding.error() factory method."""
-        attr = Attribute(
-            id="test_attr",
-            name="Test",
-            category="Testing",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
-        finding = Finding.error(attr, reason="Unexpected exception occurred")
+        finding = Finding.error(sample_attr, reason="Unexpected exception occurred")
 
         assert finding.status == "error"
         assert finding.score is None
@@ -999,114 +907,40 @@ class TestFindingFactories:
 class TestFindingValidation:
     """Test Finding validation beyond existing tests."""
 
-    def test_finding_pass_requires_score(self):
-        """Test Finding with pass status requires score."""
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
-        with pytest.raises(ValueError, match="Score required"):
-            Finding(
-                attribute=attr,
-                status="pass",
-                score=None,
-                measured_value="test",
-                threshold="test",
-                evidence=[],
-                remediation=None,
-                error_message=None,
-            )
-
-    def test_finding_fail_requires_score(self):
-        """Test Finding with fail status requires score."""
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
-        with pytest.raises(ValueError, match="Score required"):
-            Finding(
-                attribute=attr,
-                status="fail",
-                score=None,
-                measured_value="test",
-                threshold="test",
-                evidence=[],
-                remediation=None,
-                error_message=None,
-            )
-
-    def test_finding_score_out_of_range(self):
-        """Test Finding validation for score range."""
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
-        with pytest.raises(ValueError, match="must be in range"):
-            Finding(
-                attribute=attr,
-                status="pass",
-                score=150.0,
-                measured_value="test",
-                threshold="test",
-                evidence=[],
-                remediation=None,
-                error_message=None,
-            )
-
-    def test_finding_error_requires_message(self):
-        """Test Finding with error status requires error_message."""
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
-        with pytest.raises(ValueError, match="Error message required"):
-            Finding(
-                attribute=attr,
-                status="error",
-                score=None,
-                measured_value=None,
-                threshold=None,
-                evidence=[],
-                remediation=None,
-                error_message=None,
-            )
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            pytest.param(
+                {"status": "invalid", "score": 50.0},
+                "Status must be",
+                id="invalid_status",
+            ),
+            pytest.param({"score": None}, "Score required", id="pass_requires_score"),
+            pytest.param(
+                {"status": "fail", "score": None},
+                "Score required",
+                id="fail_requires_score",
+            ),
+            pytest.param({"score": 150.0}, "must be in range", id="score_out_of_range"),
+            pytest.param(
+                {
+                    "status": "error",
+                    "score": None,
+                    "measured_value": None,
+                    "threshold": None,
+                },
+                "Error message required",
+                id="error_requires_message",
+            ),
+        ],
+    )
+    def test_finding_invalid(self, make_finding, overrides, match):
+        """Test Finding status, score and error_message validation."""
+        with pytest.raises(ValueError, match=match):
+            make_finding(**overrides)
 
-    def test_finding_to_dict_with_remediation(self):
+    def test_finding_to_dict_with_remediation(self, make_finding):
         """Test Finding.to_dict() with remediation."""
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
         remediation = Remediation(
             summary="Fix it",
             steps=["Step 1"],
@@ -1116,15 +950,12 @@ class TestFindingValidation:
             citations=[],
         )
 
-        finding = Finding(
-            attribute=attr,
+        finding = make_finding(
             status="fail",
             score=0.0,
             measured_value="missing",
-            threshold="present",
             evidence=["File not found"],
             remediation=remediation,
-            error_message=None,
         )
 
         data = finding.to_dict()
@@ -1134,28 +965,9 @@ class TestFindingValidation:
         assert data["remediation"] is not None
         assert data["remediation"]["summary"] == "Fix it"
 
-    def test_finding_to_dict_without_remediation(self):
+    def test_finding_to_dict_without_remediation(self, make_finding):
         """Test Finding.to_dict() without remediation."""
-        attr = Attribute(
-            id="test",
-            name="Test",
-            category="Test",
-            tier=1,
-            description="Test",
-            criteria="Test",
-            default_weight=0.04,
-        )
-
-        finding = Finding(
-            attribute=attr,
-            status="pass",
-            score=100.0,
-            measured_value="present",
-            threshold="present",
-            evidence=["File found"],
-            remediation=None,
-            error_message=None,
-        )
+        finding = make_finding(evidence=["File found"])
 
         data = finding.to_dict()
 
@@ -1167,26 +979,16 @@ class TestFindingValidation:
 class TestRemediationValidation:
     """Test Remediation validation."""
 
-    def test_remediation_empty_summary(self):
-        """Test Remediation validation for empty summary."""
-        with pytest.raises(ValueError, match="summary must be non-empty"):
-            Remediation(
-                summary="",
-                steps=["Step 1"],
-                tools=[],
-                commands=[],
-                examples=[],
-                citations=[],
-            )
-
-    def test_remediation_empty_steps(self):
-        """Test Remediation validation for empty steps."""
-        with pytest.raises(ValueError, match="at least one step"):
-            Remediation(
-                summary="Fix it",
-                steps=[],
-                tools=[],
-                commands=[],
-                examples=[],
-                citations=[],
-            )
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            pytest.param(
+                {"summary": ""}, "summary must be non-empty", id="empty_summary"
+            ),
+            pytest.param({"steps": []}, "at least one step", id="empty_steps"),
+        ],
+    )
+    def test_remediation_invalid(self, overrides, match):
+        """Test Remediation validation errors."""
+        with pytest.raises(ValueError, match=match):
+            Remediation(**_remediation_kwargs(**overrides))
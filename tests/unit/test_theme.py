@@ -4,6 +4,15 @@ import pytest
 
 from agentready.models.theme import Theme, validate_theme_contrast
 
+# Built-in theme names, resolved once for parametrization
+BUILT_IN_THEMES = Theme.get_available_themes()
+
+
+@pytest.fixture(scope="module")
+def default_theme():
+    """Built-in default theme (a shared registry entry; treat as read-only)."""
+    return Theme.get_theme("default")
+
 
 class TestTheme:
     """Test Theme model and functionality."""
@@ -35,10 +44,9 @@ class TestTheme:
         assert theme.background == "#000000"
         assert theme.primary == "#3333ff"
 
-    def test_theme_to_css_vars(self):
+    def test_theme_to_css_vars(self, default_theme):
         """Test converting theme to CSS custom properties."""
-        theme = Theme.get_theme("default")
-        css_vars = theme.to_css_vars()
+        css_vars = default_theme.to_css_vars()
 
         assert "--background" in css_vars
         assert "--surface" in css_vars
@@ -46,10 +54,9 @@ class TestTheme:
         assert "--text-primary" in css_vars
         assert len(css_vars) == 15  # All theme properties
 
-    def test_theme_to_dict(self):
+    def test_theme_to_dict(self, default_theme):
         """Test converting theme to dictionary."""
-        theme = Theme.get_theme("default")
-        theme_dict = theme.to_dict()
+        theme_dict = default_theme.to_dict()
 
         assert theme_dict["name"] == "default"
         assert theme_dict["display_name"] == "Default (Dark Professional)"
@@ -84,50 +91,27 @@ class TestTheme:
         assert theme.display_name == "Custom Theme"
         assert theme.background == "#000000"
 
-    def test_get_theme_default(self):
-        """Test getting default theme."""
-        theme = Theme.get_theme("default")
-
-        assert theme.name == "default"
-        assert theme.display_name == "Default (Dark Professional)"
-
-    def test_get_theme_light(self):
-        """Test getting light theme."""
-        theme = Theme.get_theme("light")
-
-        assert theme.name == "light"
-        assert theme.display_name == "Light"
-        assert theme.background == "#f8fafc"  # Light background
-
-    def test_get_theme_dark(self):
-        """Test getting dark theme."""
-        theme = Theme.get_theme("dark")
-
-        assert theme.name == "dark"
-        assert theme.display_name == "Dark"
-        assert theme.background == "#0f172a"  # Dark background
-
-    def test_get_theme_high_contrast(self):
-        """Test getting high contrast theme."""
-        theme = Theme.get_theme("high-contrast")
-
-        assert theme.name == "high-contrast"
-        assert theme.display_name == "High Contrast"
-        assert theme.background == "#000000"  # Pure black
-
-    def test_get_theme_solarized(self):
-        """Test getting solarized dark theme."""
-        theme = Theme.get_theme("solarized-dark")
-
-        assert theme.name == "solarized-dark"
-        assert theme.display_name == "Solarized Dark"
-
-    def test_get_theme_dracula(self):
-        """Test getting dracula theme."""
-        theme = Theme.get_theme("dracula")
-
-        assert theme.name == "dracula"
-        assert theme.display_name == "Dracula"
+    @pytest.mark.parametrize(
+        ("theme_name", "display_name", "background"),
+        [
+            pytest.param("default", "Default (Dark Professional)", None, id="default"),
+            pytest.param("light", "Light", "#f8fafc", id="light"),
+            pytest.param("dark", "Dark", "#0f172a", id="dark"),
+            pytest.param(
+                "high-contrast", "High Contrast", "#000000", id="high_contrast"
+            ),
+            pytest.param("solarized-dark", "Solarized Dark", None, id="solarized"),
+            pytest.param("dracula", "Dracula", None, id="dracula"),
+        ],
+    )
+    def test_get_theme(self, theme_name, display_name, background):
+        """Test getting each built-in theme by name."""
+        theme = Theme.get_theme(theme_name)
+
+        assert theme.name == theme_name
+        assert theme.display_name == display_name
+        if background is not None:
+            assert theme.background == background
 
     def test_get_theme_not_found(self):
         """Test getting non-existent theme raises KeyError."""
@@ -146,66 +130,42 @@ class TestTheme:
         assert "dracula" in themes
         assert len(themes) == 6
 
-    def test_built_in_themes_complete(self):
-        """Test all built-in themes have required fields."""
-        for theme_name in Theme.get_available_themes():
-            theme = Theme.get_theme(theme_name)
-
-            # Verify all fields are present
-            assert theme.name
-            assert theme.display_name
-            assert theme.background
-            assert theme.surface
-            assert theme.surface_elevated
-            assert theme.primary
-            assert theme.primary_light
-            assert theme.primary_dark
-            assert theme.text_primary
-            assert theme.text_secondary
-            assert theme.text_muted
-            assert theme.success
-            assert theme.warning
-            assert theme.danger
-            assert theme.neutral
-            assert theme.border
-            assert theme.shadow
+    @pytest.mark.parametrize("theme_name", BUILT_IN_THEMES)
+    def test_built_in_theme_complete(self, theme_name):
+        """Test each built-in theme has all required fields."""
+        theme = Theme.get_theme(theme_name)
+
+        # Verify all fields are present
+        assert theme.name
+        assert theme.display_name
+        assert theme.background
+        assert theme.surface
+        assert theme.surface_elevated
+        assert theme.primary
+        assert theme.primary_light
+        assert theme.primary_dark
+        assert theme.text_primary
+        assert theme.text_secondary
+        assert theme.text_muted
+        assert theme.success
+        assert theme.warning
+        assert theme.danger
+        assert theme.neutral
+        assert theme.border
+        assert theme.shadow
 
 
 class TestThemeValidation:
     """Test theme accessibility validation."""
 
-    def test_validate_theme_high_contrast(self):
-        """Test high contrast theme passes validation."""
-        theme = Theme.get_theme("high-contrast")
-        warnings = validate_theme_contrast(theme)
-
-        # High contrast theme should have no warnings
-        assert len(warnings) == 0
-
-    def test_validate_theme_default(self):
-        """Test default theme validation."""
-        theme = Theme.get_theme("default")
+    @pytest.mark.parametrize("theme_name", BUILT_IN_THEMES)
+    def test_validate_built_in_theme(self, theme_name):
+        """Test each built-in theme meets accessibility standards."""
+        theme = Theme.get_theme(theme_name)
         warnings = validate_theme_contrast(theme)
 
-        # Default theme should be accessible
-        assert len(warnings) == 0
-
-    def test_validate_theme_light(self):
-        """Test light theme validation."""
-        theme = Theme.get_theme("light")
-        warnings = validate_theme_contrast(theme)
-
-        # Light theme should be accessible
-        assert len(warnings) == 0
-
-    def test_validate_all_built_in_themes(self):
-        """Test all built-in themes meet accessibility standards."""
-        for theme_name in Theme.get_available_themes():
-            theme = Theme.get_theme(theme_name)
-            warnings = validate_theme_contrast(theme)
-
-            # All built-in themes should pass WCAG 2.1 AA
-            assert len(warnings) == 0, f"Theme {theme_name} has warnings: {warnings}"
+        # All built-in themes should pass WCAG 2.1 AA
+        assert len(warnings) == 0, f"Theme {theme_name} has warnings: {warnings}"
 
     def test_validate_poor_contrast_theme(self):
         """Test validation detects poor contrast."""
@@ -234,33 +194,25 @@ class TestThemeValidation:
 
         # Should detect poor contrast
         assert len(warnings) > 0
-        assert any("Primary text on background" in w for w in warnings)
+        assert "Primary text on background" in "\n".join(warnings)
 
 
 class TestThemeRoundtrip:
     """Test theme serialization and deserialization."""
 
-    def test_theme_dict_roundtrip(self):
+    def test_theme_dict_roundtrip(self, default_theme):
         """Test converting theme to dict and back preserves data."""
-        original = Theme.get_theme("default")
-        theme_dict = original.to_dict()
+        theme_dict = default_theme.to_dict()
         restored = Theme.from_dict(theme_dict)
 
-        assert restored.name == original.name
-        assert restored.display_name == original.display_name
-        assert restored.background == original.background
-        assert restored.surface == original.surface
-        assert restored.primary == original.primary
-        assert restored.text_primary == original.text_primary
+        # Dataclass equality compares every theme field
+        assert restored == default_theme
 
-    def test_css_vars_have_correct_format(self):
+    def test_css_vars_have_correct_format(self, default_theme):
         """Test CSS variables are correctly formatted."""
-        theme = Theme.get_theme("default")
-        css_vars = theme.to_css_vars()
-
-        for key, value in css_vars.items():
-            # Keys should start with --
-            assert key.startswith("--")
-            # Values should be valid CSS colors or shadows
-            assert isinstance(value, str)
-            assert len(value) > 0
+        css_vars = default_theme.to_css_vars()
+
+        # Keys should start with --
+        assert all(key.startswith("--") for key in css_vars)
+        # Values should be non-empty CSS colors or shadows
+        assert all(isinstance(value, str) and value for value in css_vars.values())